@@ -14,25 +14,54 @@ Credentials are stored at ~/.claude/integrations/google/credentials/
 This location persists across plugin updates and reinstalls.
 """
 
+from __future__ import annotations
+
 import json
+import os
+import socket
 import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 try:
-    from google.oauth2.credentials import Credentials
-    from google.auth.transport.requests import Request
-    from google_auth_oauthlib.flow import InstalledAppFlow
+    import fcntl
+except ImportError:  # Windows: no advisory locks, refreshes are simply not serialized
+    fcntl = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
 except ImportError:
-    print("Missing dependencies. Install with:")
-    print("  pip install google-auth-oauthlib google-auth google-api-python-client")
-    sys.exit(1)
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+INSTALL_HINT = (
+    "Missing dependencies. Install with:\n"
+    "  pip install google-auth-oauthlib google-auth google-api-python-client"
+)
 
 # Credentials stored at a fixed user-level location (persists across plugin updates)
 CREDENTIALS_DIR = Path.home() / '.claude' / 'integrations' / 'google' / 'credentials'
 CLIENT_SECRETS_FILE = CREDENTIALS_DIR / 'client_secrets.json'
+CLIENT_SECRETS_PATH = str(CLIENT_SECRETS_FILE)
 TOKEN_FILE = CREDENTIALS_DIR / 'token.json'
 
+# Refresh this long before expiry so a token never lapses mid-request
+REFRESH_SKEW = timedelta(minutes=5)
+
+# In-process caches: scripts often call several get_*_credentials helpers back-to-back
+_CRED_CACHE: dict[tuple[str, frozenset[str]], Credentials] = {}
+_TOKEN_CACHE: dict[str, dict] = {}  # profile -> {'mtime', 'data', 'scopes_fs'}
+_DIR_ENSURED = False
+
 # Scope aliases for convenience
 SCOPE_ALIASES = {
     'gmail.readonly': 'https://www.googleapis.com/auth/gmail.readonly',
@@ -56,6 +85,7 @@ SCOPE_ALIASES = {
     'calendar.events': 'https://www.googleapis.com/auth/calendar.events',
     'calendar.events.readonly': 'https://www.googleapis.com/auth/calendar.events.readonly',
 }
+SCOPE_URL_TO_ALIAS = {v: k for k, v in SCOPE_ALIASES.items()}
 
 
 def get_token_file(profile: str = 'default') -> Path:
@@ -67,75 +97,163 @@ def get_token_file(profile: str = 'default') -> Path:
 
 def resolve_scopes(scopes: list[str]) -> list[str]:
     """Convert scope aliases to full URLs."""
-    resolved = []
-    for scope in scopes:
-        if scope in SCOPE_ALIASES:
-            resolved.append(SCOPE_ALIASES[scope])
-        elif scope.startswith('https://'):
-            resolved.append(scope)
-        else:
-            resolved.append(f'https://www.googleapis.com/auth/{scope}')
-    return resolved
+    alias = SCOPE_ALIASES.get
+    return [
+        alias(scope) or (scope if scope.startswith('https://') else f'https://www.googleapis.com/auth/{scope}')
+        for scope in scopes
+    ]
 
 
-def load_token(profile: str = 'default') -> Optional[dict]:
-    """Load token data from file."""
+def _ensure_credentials_dir():
+    """Create CREDENTIALS_DIR at most once per process."""
+    global _DIR_ENSURED
+    if not _DIR_ENSURED:
+        CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
+        _DIR_ENSURED = True
+
+
+def _load_token_entry(profile: str = 'default') -> Optional[dict]:
+    """Load token data plus its scope set, cached until the file changes."""
     token_file = get_token_file(profile)
-    if not token_file.exists():
+    try:
+        mtime = os.stat(token_file).st_mtime_ns
+        cached = _TOKEN_CACHE.get(profile)
+        if cached and cached['mtime'] == mtime:
+            return cached
+        with open(token_file, 'rb') as f:
+            token_data = _json_loads(f.read())
+    except FileNotFoundError:
+        _TOKEN_CACHE.pop(profile, None)
         return None
-    with open(token_file, 'r') as f:
-        return json.load(f)
+    entry = {
+        'mtime': mtime,
+        'data': token_data,
+        'scopes_fs': frozenset(token_data.get('scopes', [])),
+    }
+    _TOKEN_CACHE[profile] = entry
+    return entry
+
+
+def load_token(profile: str = 'default') -> Optional[dict]:
+    """Load token data from file."""
+    entry = _load_token_entry(profile)
+    return entry['data'] if entry else None
 
 
 def save_token(credentials: Credentials, scopes: list[str], profile: str = 'default'):
     """Save credentials to token file."""
-    CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_credentials_dir()
     token_data = {
         'token': credentials.token,
         'refresh_token': credentials.refresh_token,
         'token_uri': credentials.token_uri,
         'client_id': credentials.client_id,
         'client_secret': credentials.client_secret,
-        'scopes': scopes
+        'scopes': scopes,
+        'expiry': credentials.expiry.isoformat() if credentials.expiry else None,
     }
     token_file = get_token_file(profile)
-    with open(token_file, 'w') as f:
-        json.dump(token_data, f, indent=2)
+    # Write to a temp file and rename so readers never see a truncated token
+    tmp_file = token_file.with_suffix(token_file.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(token_data))  # compact: machine-read only
+        f.flush()
+        os.fsync(f.fileno())
+    os.chmod(tmp_file, 0o600)
+    os.replace(tmp_file, token_file)
+
+
+def _require_google():
+    """Import the Google auth SDK on first use; it is slow to import."""
+    try:
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+    except ImportError as e:
+        raise RuntimeError(INSTALL_HINT) from e
+    return Credentials, Request
+
+
+def _credentials_from_token(token_data: dict, scopes: list[str]) -> Credentials:
+    """Build Credentials from stored token data."""
+    Credentials, _ = _require_google()
+    expiry = token_data.get('expiry')
+    return Credentials(
+        token=token_data['token'],
+        refresh_token=token_data['refresh_token'],
+        token_uri=token_data['token_uri'],
+        client_id=token_data['client_id'],
+        client_secret=token_data['client_secret'],
+        scopes=scopes,
+        expiry=datetime.fromisoformat(expiry) if expiry else None,
+    )
+
+
+def _needs_refresh(credentials: Credentials) -> bool:
+    """True if the access token is expired or expires within REFRESH_SKEW."""
+    if credentials.expiry is None:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # google-auth uses naive UTC
+    return credentials.expiry - now < REFRESH_SKEW
+
+
+@contextmanager
+def _token_lock(profile: str = 'default'):
+    """Serialize refresh+save across processes sharing a token file."""
+    if fcntl is None:
+        yield
+        return
+    _ensure_credentials_dir()
+    lock_file = get_token_file(profile).with_suffix('.lock')
+    with open(lock_file, 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
 
 
 def get_credentials(required_scopes: list[str], interactive: bool = True, profile: str = 'default') -> Credentials:
     """Get Google OAuth credentials with required scopes."""
     required_scopes = resolve_scopes(required_scopes)
+    required_fs = frozenset(required_scopes)
+    cache_key = (profile, required_fs)
+    cached = _CRED_CACHE.get(cache_key)
+    if cached is not None and not _needs_refresh(cached):
+        return cached
+
     if not CLIENT_SECRETS_FILE.exists():
         raise RuntimeError(f"Client secrets not found at {CLIENT_SECRETS_FILE}")
 
-    token_data = load_token(profile)
+    entry = _load_token_entry(profile)
+    token_data = entry['data'] if entry else None
     credentials = None
 
     if token_data:
-        existing_scopes = set(token_data.get('scopes', []))
-        if set(required_scopes).issubset(existing_scopes):
-            credentials = Credentials(
-                token=token_data['token'],
-                refresh_token=token_data['refresh_token'],
-                token_uri=token_data['token_uri'],
-                client_id=token_data['client_id'],
-                client_secret=token_data['client_secret'],
-                scopes=list(existing_scopes)
-            )
-            if credentials.expired and credentials.refresh_token:
-                try:
-                    credentials.refresh(Request())
-                    save_token(credentials, list(existing_scopes), profile)
-                except Exception as e:
-                    print(f"Token refresh failed: {e}", file=sys.stderr)
-                    credentials = None
+        existing_scopes = entry['scopes_fs']
+        if required_fs <= existing_scopes:
+            scope_list = list(existing_scopes)
+            credentials = _credentials_from_token(token_data, scope_list)
+            if _needs_refresh(credentials) and credentials.refresh_token:
+                with _token_lock(profile):
+                    # Another process may have refreshed while we waited for the lock
+                    latest = load_token(profile)
+                    if latest and latest is not token_data:
+                        credentials = _credentials_from_token(latest, scope_list)
+                    if _needs_refresh(credentials):
+                        try:
+                            _, Request = _require_google()
+                            credentials.refresh(Request())
+                            save_token(credentials, scope_list, profile)
+                        except Exception as e:
+                            print(f"Token refresh failed: {e}", file=sys.stderr)
+                            _CRED_CACHE.pop(cache_key, None)
+                            credentials = None
         else:
-            missing = set(required_scopes) - existing_scopes
+            missing = required_fs - existing_scopes
             if not interactive:
-                raise RuntimeError(f"Missing scopes: {missing}\nRun: python oauth_setup.py --profile {profile} --add-scope ...")
-            all_scopes = list(existing_scopes | set(required_scopes))
-            print(f"Requesting additional scopes: {missing}", file=sys.stderr)
+                raise RuntimeError(f"Missing scopes: {', '.join(sorted(missing))}\nRun: python oauth_setup.py --profile {profile} --add-scope ...")
+            all_scopes = list(existing_scopes | required_fs)
+            print(f"Requesting additional scopes: {', '.join(sorted(missing))}", file=sys.stderr)
             credentials = run_oauth_flow(all_scopes)
             save_token(credentials, all_scopes, profile)
 
@@ -145,26 +263,50 @@ def get_credentials(required_scopes: list[str], interactive: bool = True, profil
         credentials = run_oauth_flow(required_scopes)
         save_token(credentials, required_scopes, profile)
 
+    _CRED_CACHE[cache_key] = credentials
     return credentials
 
 
-def run_oauth_flow(scopes: list[str], port: int = 8080) -> Credentials:
-    """Run interactive OAuth authorization flow."""
-    print("Starting OAuth authorization flow...", file=sys.stderr)
-    flow = InstalledAppFlow.from_client_secrets_file(str(CLIENT_SECRETS_FILE), scopes=scopes)
-    for try_port in [port, 8081, 8082, 8090, 9000]:
-        try:
-            return flow.run_local_server(port=try_port, prompt='consent', success_message='Authorization complete!')
-        except OSError as e:
-            if e.errno == 48:
-                print(f"Port {try_port} in use, trying next...", file=sys.stderr)
+def _find_free_port(candidates: list[int]) -> int:
+    """Return the first candidate port that can be bound on localhost."""
+    for candidate in candidates:
+        with socket.socket() as s:
+            try:
+                s.bind(('localhost', candidate))
+            except OSError:
+                print(f"Port {candidate} in use, trying next...", file=sys.stderr)
                 continue
-            raise
+        return candidate
     raise RuntimeError("All ports in use")
 
 
-def check_credentials_available(scopes: list[str], profile: str = 'default') -> bool:
-    """Check if credentials are available for given scopes."""
+def run_oauth_flow(scopes: list[str], port: int = 8080) -> Credentials:
+    """Run interactive OAuth authorization flow (port=0 lets the OS pick)."""
+    try:
+        from google_auth_oauthlib.flow import InstalledAppFlow
+    except ImportError as e:
+        raise RuntimeError(INSTALL_HINT) from e
+
+    print("Starting OAuth authorization flow...", file=sys.stderr)
+    if port != 0:
+        port = _find_free_port([port, 8081, 8082, 8090, 9000])
+    flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRETS_PATH, scopes=scopes)
+    return flow.run_local_server(port=port, prompt='consent', success_message='Authorization complete!')
+
+
+def check_credentials_available(scopes: list[str], profile: str = 'default', allow_network: bool = False) -> bool:
+    """Check if credentials are available for given scopes.
+
+    By default only the stored token is inspected. With allow_network=True an
+    expiring token is also refreshed to confirm it still works.
+    """
+    if not CLIENT_SECRETS_FILE.exists():
+        return False
+    entry = _load_token_entry(profile)
+    if entry is None or not frozenset(resolve_scopes(scopes)) <= entry['scopes_fs']:
+        return False
+    if not allow_network:
+        return True
     try:
         get_credentials(scopes, interactive=False, profile=profile)
         return True
@@ -174,8 +316,8 @@ def check_credentials_available(scopes: list[str], profile: str = 'default') ->
 
 def get_authorized_scopes(profile: str = 'default') -> list[str]:
     """Get list of currently authorized scopes."""
-    token_data = load_token(profile)
-    return token_data.get('scopes', []) if token_data else []
+    entry = _load_token_entry(profile)
+    return entry['data'].get('scopes', []) if entry else []
 
 
 # Convenience functions for common services
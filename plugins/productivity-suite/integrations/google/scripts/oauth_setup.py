@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -24,22 +25,32 @@ from google_auth import (
     resolve_scopes,
     CLIENT_SECRETS_FILE,
     TOKEN_FILE,
-    SCOPE_ALIASES
+    SCOPE_URL_TO_ALIAS,
 )
 
+# Scope aliases grouped for --scopes output
+_SCOPE_CATEGORIES = {
+    'Gmail': ['gmail.readonly', 'gmail.modify', 'gmail.send', 'gmail.compose'],
+    'Calendar': ['calendar', 'calendar.readonly', 'calendar.events', 'calendar.events.readonly'],
+    'Drive': ['drive', 'drive.readonly', 'drive.file'],
+    'Sheets': ['spreadsheets', 'spreadsheets.readonly'],
+    'Docs': ['documents', 'documents.readonly'],
+}
+
 
 def show_status(profile: str = None):
     """Display current authentication status."""
-    print("Google OAuth Status")
-    print("=" * 50)
+    # Collect lines and write once instead of one print() per line
+    out = ["Google OAuth Status", "=" * 50]
 
     # Check client secrets
     if CLIENT_SECRETS_FILE.exists():
-        print(f"Client secrets: Found")
+        out.append("Client secrets: Found")
     else:
-        print(f"Client secrets: NOT FOUND")
-        print(f"  Expected at: {CLIENT_SECRETS_FILE}")
-        print(f"  See modules/SETUP.md for instructions")
+        out.append("Client secrets: NOT FOUND")
+        out.append(f"  Expected at: {CLIENT_SECRETS_FILE}")
+        out.append("  See modules/SETUP.md for instructions")
+        sys.stdout.write('\n'.join(out) + '\n')
         return
 
     # Show specific profile or default
@@ -47,43 +58,31 @@ def show_status(profile: str = None):
 
     for p in profiles_to_show:
         token_file = get_token_file(p)
-        print(f"\nProfile '{p}':")
+        out.append(f"\nProfile '{p}':")
         if token_file.exists():
-            print(f"  Token file: Found")
+            out.append("  Token file: Found")
             scopes = get_authorized_scopes(p)
             if scopes:
-                print(f"  Authorized scopes ({len(scopes)}):")
-                for scope in sorted(scopes):
-                    alias = next((k for k, v in SCOPE_ALIASES.items() if v == scope), None)
-                    if alias:
-                        print(f"    - {alias}")
-                    else:
-                        print(f"    - {scope}")
+                out.append(f"  Authorized scopes ({len(scopes)}):")
+                out.extend(f"    - {SCOPE_URL_TO_ALIAS.get(scope, scope)}" for scope in sorted(scopes))
             else:
-                print("  No scopes in token (may be corrupted)")
+                out.append("  No scopes in token (may be corrupted)")
         else:
-            print(f"  Token file: NOT FOUND")
+            out.append("  Token file: NOT FOUND")
 
-    print()
+    out.append("")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def show_available_scopes():
     """Display available scope aliases."""
-    print("\nAvailable scope aliases:")
-    print("-" * 40)
+    out = ["\nAvailable scope aliases:", "-" * 40]
 
-    categories = {
-        'Gmail': ['gmail.readonly', 'gmail.modify', 'gmail.send', 'gmail.compose'],
-        'Calendar': ['calendar', 'calendar.readonly', 'calendar.events', 'calendar.events.readonly'],
-        'Drive': ['drive', 'drive.readonly', 'drive.file'],
-        'Sheets': ['spreadsheets', 'spreadsheets.readonly'],
-        'Docs': ['documents', 'documents.readonly'],
-    }
+    for category, scopes in _SCOPE_CATEGORIES.items():
+        out.append(f"\n{category}:")
+        out.extend(f"  {scope}" for scope in scopes)
 
-    for category, scopes in categories.items():
-        print(f"\n{category}:")
-        for scope in scopes:
-            print(f"  {scope}")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def initial_setup(scopes: list[str] = None, profile: str = 'default'):
@@ -149,13 +148,11 @@ def add_scopes(new_scopes: list[str], profile: str = 'default'):
     print(f"Adding scopes: {need_auth}")
 
     # Get credentials with combined scopes (triggers re-auth)
+    # Already full URLs; resolve_scopes passes them through unchanged
     all_scopes = list(set(existing) | set(resolved_new))
 
-    # Convert back to aliases for cleaner output
-    aliases = [next((k for k, v in SCOPE_ALIASES.items() if v == s), s) for s in all_scopes]
-
     try:
-        credentials = get_credentials(aliases, interactive=True, profile=profile)
+        credentials = get_credentials(all_scopes, interactive=True, profile=profile)
         print()
         print("Scopes added successfully!")
         show_status(profile)
@@ -166,19 +163,25 @@ def add_scopes(new_scopes: list[str], profile: str = 'default'):
 
 def refresh_auth(profile: str = 'default'):
     """Force re-authentication."""
-    token_file = get_token_file(profile)
-    if token_file.exists():
-        token_file.unlink()
-        print(f"Removed existing token for profile '{profile}'.")
-
     existing_scopes = get_authorized_scopes(profile)
     scopes = existing_scopes if existing_scopes else ['gmail.readonly', 'gmail.modify', 'drive', 'spreadsheets', 'documents']
 
-    # Convert to aliases
-    aliases = [next((k for k, v in SCOPE_ALIASES.items() if v == s), s) for s in scopes]
+    # Move the old token aside (not unlink) so a failed re-auth can restore it
+    token_file = get_token_file(profile)
+    backup_file = token_file.with_suffix(token_file.suffix + '.bak')
+    if token_file.exists():
+        os.replace(token_file, backup_file)
+        print(f"Moved existing token for profile '{profile}' aside.")
 
     print("Re-authenticating...")
-    initial_setup(aliases, profile)
+    try:
+        initial_setup(scopes, profile)
+    finally:
+        if backup_file.exists():
+            if token_file.exists():
+                backup_file.unlink()
+            else:
+                os.replace(backup_file, token_file)
 
 
 def revoke_credentials(profile: str = 'default'):
@@ -194,6 +197,46 @@ def revoke_credentials(profile: str = 'default'):
         print(f"No stored credentials found for profile '{profile}'.")
 
 
+def _cmd_status(args):
+    show_status(args.profile if args.profile != 'default' else None)
+
+
+def _cmd_scopes(args):
+    show_available_scopes()
+
+
+def _cmd_add_scope(args):
+    add_scopes(args.add_scope, args.profile)
+
+
+def _cmd_refresh(args):
+    refresh_auth(args.profile)
+
+
+def _cmd_revoke(args):
+    revoke_credentials(args.profile)
+
+
+def _cmd_default(args):
+    """Run initial setup, or show status if already set up."""
+    token_file = get_token_file(args.profile)
+    if token_file.exists():
+        show_status(args.profile)
+        print(f"Profile '{args.profile}' already authenticated.")
+        print("Use --refresh to re-authenticate.")
+        print("Use --add-scope to add additional permissions.")
+    else:
+        initial_setup(profile=args.profile)
+
+
+class _AddScopeAction(argparse.Action):
+    """Collect --add-scope values (repeatable) and select the add-scope command."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, (getattr(namespace, self.dest) or []) + values)
+        namespace.func = _cmd_add_scope
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Google OAuth setup — unlocks Gmail, Drive, Sheets, and Docs in one go",
@@ -206,62 +249,46 @@ Examples:
   uv run oauth_setup.py --add-scope drive.file       # Add an extra scope
 """
     )
+    parser.set_defaults(func=_cmd_default)
 
     parser.add_argument(
         '--profile', '-p',
         default='default',
         help='Account profile to use (default)'
     )
-    parser.add_argument(
+
+    # Each command flag stores its handler in args.func
+    commands = parser.add_mutually_exclusive_group()
+    commands.add_argument(
         '--status',
-        action='store_true',
+        action='store_const', dest='func', const=_cmd_status,
         help='Show current authentication status'
     )
-    parser.add_argument(
+    commands.add_argument(
         '--add-scope',
         nargs='+',
+        action=_AddScopeAction,
         metavar='SCOPE',
         help='Add additional scope(s) to authorization'
     )
-    parser.add_argument(
+    commands.add_argument(
         '--refresh',
-        action='store_true',
+        action='store_const', dest='func', const=_cmd_refresh,
         help='Force re-authentication'
     )
-    parser.add_argument(
+    commands.add_argument(
         '--revoke',
-        action='store_true',
+        action='store_const', dest='func', const=_cmd_revoke,
         help='Remove stored credentials'
     )
-    parser.add_argument(
+    commands.add_argument(
         '--scopes',
-        action='store_true',
+        action='store_const', dest='func', const=_cmd_scopes,
         help='List available scope aliases'
     )
 
     args = parser.parse_args()
-
-    # Handle commands
-    if args.status:
-        show_status(args.profile if args.profile != 'default' else None)
-    elif args.scopes:
-        show_available_scopes()
-    elif args.add_scope:
-        add_scopes(args.add_scope, args.profile)
-    elif args.refresh:
-        refresh_auth(args.profile)
-    elif args.revoke:
-        revoke_credentials(args.profile)
-    else:
-        # Default: run initial setup or show status if already set up
-        token_file = get_token_file(args.profile)
-        if token_file.exists():
-            show_status(args.profile)
-            print(f"Profile '{args.profile}' already authenticated.")
-            print("Use --refresh to re-authenticate.")
-            print("Use --add-scope to add additional permissions.")
-        else:
-            initial_setup(profile=args.profile)
+    args.func(args)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,639 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["aiohttp>=3.9.0", "orjson>=3.9", "zstandard>=0.22", "python-dotenv>=1.0", "uvloop>=0.19; sys_platform != 'win32'"]
+# ///
+"""
+Apify API Client
+
+Shared helpers for the Apify scripts: one pooled aiohttp session per
+process, and the start -> poll -> fetch cycle for actor runs.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from collections import deque
+from contextlib import aclosing
+from pathlib import Path
+from typing import AsyncIterator
+
+import aiohttp
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    dotenv_values = None
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
+
+APIFY_API_BASE = "https://api.apify.com/v2"
+
+# Endpoint templates (str.format); the token is always sent via params=
+RUN_START_URL = APIFY_API_BASE + "/acts/{}/runs"
+RUN_STATUS_URL = APIFY_API_BASE + "/actor-runs/{}"
+RUNS_LIST_URL = APIFY_API_BASE + "/actor-runs"
+DATASET_ITEMS_URL = APIFY_API_BASE + "/datasets/{}/items"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+ENV_LOCATIONS = [
+    Path.cwd() / ".env",
+    Path(__file__).parent.parent.parent.parent / ".env",
+    Path.home() / "Coding" / "The Crucible" / ".env",
+    Path.home() / "Coding" / "1. General Work" / "The Crucible" / ".env",
+]
+_ENV_LINE_RE = re.compile(rb"^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t]*\r?$", re.M)
+_env_loaded = False
+
+# Observed run durations per actor, used to place status polls
+DURATIONS_FILE = Path.home() / ".cache" / "apify_run_durations.json"
+MAX_DURATION_SAMPLES = 100
+MIN_DURATION_SAMPLES = 5
+
+# Datasets are fetched in pages; pages after the first are downloaded
+# concurrently, at most DATASET_PAGE_WINDOW ahead of the consumer
+DATASET_PAGE_SIZE = 1000
+DATASET_PAGE_WINDOW = 4
+# A page can be large, so allow longer than REQUEST_TIMEOUT but fail a
+# connection that stops sending
+PAGE_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=10, sock_read=60)
+
+# Per-request bound for short API calls, so one stuck connection cannot
+# eat the whole run timeout
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# The run-start request asks Apify to hold the response until the run
+# finishes, for up to this many seconds (the API maximum), so short runs
+# need no status polls at all
+WAIT_FOR_FINISH_SECS = 60
+
+TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+
+# Local cache of actor results, keyed by a hash of actor + input.
+# Entries are zstd-compressed when zstandard is installed (job postings
+# compress roughly 8x), plain JSON otherwise.
+CACHE_DIR = Path.home() / ".cache" / "apify"
+DEFAULT_CACHE_TTL = 86400  # 1 day
+CACHE_SUFFIX = ".json.zst" if zstandard is not None else ".json"
+_CACHE_ERRORS = (OSError, ValueError) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def load_env_file() -> None:
+    """Load the first .env found in ENV_LOCATIONS, once per process."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    for loc in ENV_LOCATIONS:
+        if loc.exists():
+            if dotenv_values is not None:
+                values = dotenv_values(loc)
+            else:
+                # Single regex pass over the file bytes
+                values = {
+                    key.decode(): value.strip(b"\"'").decode()
+                    for key, value in _ENV_LINE_RE.findall(loc.read_bytes())
+                }
+            for key, value in values.items():
+                if value is not None:  # dotenv gives None for bare "KEY" lines
+                    os.environ.setdefault(key, value)
+            break
+
+
+def get_api_key() -> str:
+    """Get Apify API key from environment."""
+    load_env_file()
+    key = os.environ.get("APIFY_API_KEY")
+    if not key:
+        print("Error: APIFY_API_KEY not found in environment", file=sys.stderr)
+        print("Set it in your .env file or export it", file=sys.stderr)
+        sys.exit(1)
+    return key
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+            headers=JSON_HEADERS,
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session. Call once before the event loop exits."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def run_main(main) -> None:
+    """Run a script's main() coroutine, on uvloop when it is installed."""
+    if uvloop is not None:
+        uvloop.run(main)
+    else:
+        asyncio.run(main)
+
+
+def dump_json(data) -> bytes:
+    """Serialize results as indented JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def cache_key(namespace: str, params: dict) -> str:
+    """Stable key for a request: sha256 of the namespace and sorted params."""
+    payload = json.dumps({"actor": namespace, "input": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}{CACHE_SUFFIX}"
+
+
+def cache_get(key: str, ttl: int):
+    """Return cached data for key if younger than ttl seconds, else None."""
+    path = _cache_path(key)
+    try:
+        if path.stat().st_mtime < time.time() - ttl:
+            return None
+        data = path.read_bytes()
+        if zstandard is not None:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return _loads(data)
+    except _CACHE_ERRORS:
+        return None
+
+
+def cache_age(key: str) -> float:
+    """Seconds since the cache entry for key was written."""
+    return time.time() - _cache_path(key).stat().st_mtime
+
+
+def cache_put(key: str, data) -> None:
+    """Write data to the cache atomically (temp file + rename)."""
+    path = _cache_path(key)
+    tmp = path.with_name(path.name + ".tmp")
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+    if zstandard is not None:
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _load_durations() -> dict[str, list[float]]:
+    """Load recorded run durations, or {} if none are available."""
+    try:
+        return json.loads(DURATIONS_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def record_duration(actor_id: str, duration: float) -> None:
+    """
+    Append a successful run's duration, keeping the latest samples.
+
+    Written atomically (temp file + rename) as in cache_put, so a reader
+    never sees a half-written file. The temp name is per process, so
+    concurrent processes don't write into each other's temp file.
+    """
+    durations = _load_durations()
+    samples = durations.get(actor_id, []) + [round(duration, 1)]
+    durations[actor_id] = samples[-MAX_DURATION_SAMPLES:]
+    tmp = DURATIONS_FILE.with_name(f"{DURATIONS_FILE.name}.{os.getpid()}.tmp")
+    try:
+        DURATIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(durations))
+        os.replace(tmp, DURATIONS_FILE)
+    except OSError:
+        pass
+
+
+def poll_schedule(actor_id: str) -> list[float]:
+    """
+    Poll times (seconds after start) placed at quantiles of past durations.
+
+    Polls cluster where runs of this actor usually finish, so completion is
+    noticed quickly without extra requests. Returns [] until enough runs
+    have been recorded; callers then fall back to exponential backoff.
+    """
+    samples = _load_durations().get(actor_id, [])
+    if len(samples) < MIN_DURATION_SAMPLES:
+        return []
+    cuts = statistics.quantiles(samples, n=20, method="inclusive")  # 5% steps
+    # 10th, 25th, 50th, 75th, 90th and 95th percentiles
+    return sorted({round(cuts[i], 1) for i in (1, 4, 9, 14, 17, 18)})
+
+
+class RunPoller:
+    """
+    Waits on many actor runs with one status request per interval.
+
+    Instead of each run polling /actor-runs/{id}, a single background task
+    lists the account's most recent runs and resolves every waiter whose
+    run has finished. Pass one instance as `poller` to concurrent
+    run_actor() calls; single runs don't need it.
+
+        async with RunPoller(api_key) as poller:
+            results = await asyncio.gather(
+                *(run_actor(actor_id, p, api_key, poller=poller) for p in inputs)
+            )
+    """
+
+    def __init__(self, api_key: str, interval: float = 5.0):
+        self.api_key = api_key
+        self.interval = interval
+        self._pending: dict[str, asyncio.Future] = {}
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "RunPoller":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the background poll task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait(self, run_id: str) -> dict:
+        """Wait until run_id reaches a terminal status; returns the run object."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[run_id] = future
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._poll())
+        try:
+            return await future
+        finally:
+            self._pending.pop(run_id, None)
+
+    async def _poll(self) -> None:
+        try:
+            while self._pending:
+                await asyncio.sleep(self.interval)
+                try:
+                    await self._check_runs()
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    continue
+        except Exception as e:
+            # Don't leave waiters hanging until their timeout
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _check_runs(self) -> None:
+        session = await get_session()
+        params = {"token": self.api_key, "limit": 100, "desc": "true"}
+        async with session.get(RUNS_LIST_URL, params=params, timeout=REQUEST_TIMEOUT) as resp:
+            if resp.status >= 500:
+                resp.raise_for_status()
+            runs = (await resp.json())["data"]["items"]
+
+        listed = set()
+        for run in runs:
+            listed.add(run["id"])
+            self._resolve(run)
+
+        # On a busy account a run can drop out of the newest 100; ask for it directly
+        missing = [run_id for run_id in self._pending if run_id not in listed]
+        if missing:
+            for run in await asyncio.gather(*(self._get_run(session, run_id) for run_id in missing)):
+                self._resolve(run)
+
+    async def _get_run(self, session: aiohttp.ClientSession, run_id: str) -> dict:
+        status_url = RUN_STATUS_URL.format(run_id)
+        async with session.get(status_url, params={"token": self.api_key}, timeout=REQUEST_TIMEOUT) as resp:
+            if resp.status >= 500:
+                resp.raise_for_status()
+            return (await resp.json())["data"]
+
+    def _resolve(self, run: dict) -> None:
+        future = self._pending.get(run["id"])
+        if future is not None and not future.done() and run["status"] in TERMINAL_STATUSES:
+            future.set_result(run)
+
+
+async def wait_for_run(
+    actor_id: str,
+    input_params: dict,
+    api_key: str,
+    timeout_secs: int = 600,
+    verbose: bool = False,
+    poller: RunPoller | None = None
+) -> dict:
+    """Start an actor run and poll until it succeeds. Returns the run object."""
+    session = await get_session()
+
+    # Start the actor run
+    run_url = RUN_START_URL.format(actor_id)
+
+    if verbose:
+        print(f"Starting actor {actor_id}...", file=sys.stderr)
+        print(f"Input: {json.dumps(input_params, indent=2)}", file=sys.stderr)
+
+    started = time.monotonic()
+    wait_secs = min(WAIT_FOR_FINISH_SECS, timeout_secs)
+    async with session.post(
+        run_url,
+        params={"token": api_key, "waitForFinish": wait_secs},
+        json=input_params,
+        timeout=aiohttp.ClientTimeout(total=wait_secs + 30, connect=10)
+    ) as resp:
+        if resp.status != 201:
+            error_text = await resp.text()
+            raise Exception(f"Failed to start actor: {resp.status} - {error_text}")
+
+        run_data = await resp.json()
+        run = run_data["data"]
+        run_id = run["id"]
+
+        if verbose:
+            print(f"Run started: {run_id} ({run['status']})", file=sys.stderr)
+
+    # Only poll runs still going after the server-side wait
+    if run["status"] not in TERMINAL_STATUSES:
+        if poller is not None:
+            waiter = poller.wait(run_id)
+        else:
+            waiter = _poll_run(session, actor_id, run_id, api_key, verbose, started)
+        try:
+            run = await asyncio.wait_for(waiter, max(0.0, timeout_secs - (time.monotonic() - started)))
+        except asyncio.TimeoutError:
+            raise Exception(f"Actor run timed out after {timeout_secs}s") from None
+
+    status = run["status"]
+    if status != "SUCCEEDED":
+        raise Exception(f"Actor run failed with status: {status}")
+
+    run_secs = (run.get("stats") or {}).get("runTimeSecs")
+    record_duration(actor_id, run_secs or time.monotonic() - started)
+    return run
+
+
+async def _poll_run(
+    session: aiohttp.ClientSession,
+    actor_id: str,
+    run_id: str,
+    api_key: str,
+    verbose: bool,
+    started: float
+) -> dict:
+    """
+    Poll a run until it finishes; the caller bounds the total time.
+
+    started is the time.monotonic() at which the run was started.
+    """
+    # Back off from 1s to ~30s with jitter, and back off separately
+    # (full jitter, reset on success) on network errors, timeouts and 5xx
+    status_url = RUN_STATUS_URL.format(run_id)
+    params = {"token": api_key}
+    schedule = poll_schedule(actor_id)
+    delay = 1.0
+    err_delay = 1.0
+
+    while True:
+        elapsed = time.monotonic() - started
+        while schedule and schedule[0] <= elapsed:
+            schedule.pop(0)
+        if schedule:
+            await asyncio.sleep(schedule.pop(0) - elapsed)
+        else:
+            # Jitter only the sleep, so the base delay stays capped at 30s
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.25))
+            delay = min(30.0, delay * 1.5)
+
+        try:
+            async with session.get(status_url, params=params, timeout=REQUEST_TIMEOUT) as resp:
+                if resp.status >= 500:
+                    resp.raise_for_status()
+                status_data = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            err_delay = min(60.0, err_delay * 2)
+            if verbose:
+                print(f"Status check failed ({e}), backing off", file=sys.stderr)
+            await asyncio.sleep(random.uniform(0, err_delay))
+            continue
+        err_delay = 1.0
+
+        elapsed = time.monotonic() - started
+        status = status_data["data"]["status"]
+
+        if verbose:
+            print(f"Status: {status} ({elapsed:.0f}s elapsed)", file=sys.stderr)
+
+        if status in TERMINAL_STATUSES:
+            return status_data["data"]
+
+
+async def _iter_jsonl(resp: aiohttp.ClientResponse) -> AsyncIterator[dict]:
+    """Parse a JSONL response body line by line as chunks arrive."""
+    # Split chunks ourselves: a single item can exceed aiohttp's readline limit
+    pending = b""
+    async for chunk in resp.content.iter_chunked(1 << 16):
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _loads(line)
+    if pending.strip():
+        yield _loads(pending)
+
+
+async def _fetch_page(dataset_id: str, api_key: str, offset: int) -> list[dict]:
+    """Fetch one page of dataset items."""
+    session = await get_session()
+    params = {"token": api_key, "format": "json", "offset": offset, "limit": DATASET_PAGE_SIZE}
+    async with session.get(DATASET_ITEMS_URL.format(dataset_id), params=params, timeout=PAGE_TIMEOUT) as resp:
+        if resp.status != 200:
+            raise Exception(f"Failed to fetch results: {resp.status}")
+        return _loads(await resp.read())
+
+
+async def iter_dataset(dataset_id: str, api_key: str) -> AsyncIterator[dict]:
+    """
+    Yield dataset items in order.
+
+    The first page is streamed as JSONL. Its pagination header gives the
+    total, and the remaining pages are then downloaded concurrently while
+    the first page is still being consumed.
+    """
+    session = await get_session()
+    first_url = DATASET_ITEMS_URL.format(dataset_id)
+    first_params = {"token": api_key, "format": "jsonl", "offset": 0, "limit": DATASET_PAGE_SIZE}
+    window = deque()
+    offsets = iter(())
+
+    def schedule_next() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            window.append(asyncio.ensure_future(_fetch_page(dataset_id, api_key, offset)))
+
+    try:
+        async with session.get(first_url, params=first_params, timeout=PAGE_TIMEOUT) as resp:
+            if resp.status != 200:
+                raise Exception(f"Failed to fetch results: {resp.status}")
+
+            total = resp.headers.get("X-Apify-Pagination-Total")
+            if total is not None:
+                offsets = iter(range(DATASET_PAGE_SIZE, int(total), DATASET_PAGE_SIZE))
+                for _ in range(DATASET_PAGE_WINDOW):
+                    schedule_next()
+
+            count = 0
+            async for item in _iter_jsonl(resp):
+                count += 1
+                yield item
+
+        # Without a total, keep paging until a short page comes back
+        if total is None and count == DATASET_PAGE_SIZE:
+            offsets = itertools.count(DATASET_PAGE_SIZE, DATASET_PAGE_SIZE)
+            schedule_next()
+
+        while window:
+            items = await window.popleft()
+            if total is None and len(items) < DATASET_PAGE_SIZE:
+                offsets = iter(())
+            schedule_next()
+            for item in items:
+                yield item
+    finally:
+        for task in window:
+            task.cancel()
+        # Collect the outcomes so a prefetch that failed before the consumer
+        # reached it doesn't log "Task exception was never retrieved"
+        if window:
+            await asyncio.gather(*window, return_exceptions=True)
+
+
+async def stream_actor(
+    actor_id: str,
+    input_params: dict,
+    api_key: str,
+    timeout_secs: int = 600,
+    verbose: bool = False,
+    cache_ttl: int = DEFAULT_CACHE_TTL,
+    use_cache: bool = False,
+    force_refresh: bool = False,
+    poller: RunPoller | None = None
+) -> AsyncIterator[dict]:
+    """
+    Run an Apify actor and yield its result items as they stream in.
+
+    Takes the same arguments as run_actor. Only a fully consumed stream is
+    written to the cache.
+    """
+    key = cache_key(actor_id, input_params)
+    if use_cache and not force_refresh:
+        cached = cache_get(key, cache_ttl)
+        if cached is not None:
+            # Always say so: a cached result may be stale for time-sensitive actors
+            print(
+                f"Served from cache (age {cache_age(key):.0f}s, {len(cached)} items); "
+                f"use --force-refresh to re-run",
+                file=sys.stderr
+            )
+            for item in cached:
+                yield item
+            return
+
+    run = await wait_for_run(actor_id, input_params, api_key, timeout_secs, verbose, poller)
+
+    collected = [] if use_cache else None
+    count = 0
+    # aclosing: if the consumer stops early, cancel page prefetches right away
+    async with aclosing(iter_dataset(run["defaultDatasetId"], api_key)) as items:
+        async for item in items:
+            if collected is not None:
+                collected.append(item)
+            count += 1
+            yield item
+
+    if verbose:
+        print(f"Fetched {count} results", file=sys.stderr)
+    if collected is not None:
+        cache_put(key, collected)
+
+
+async def run_actor(
+    actor_id: str,
+    input_params: dict,
+    api_key: str,
+    timeout_secs: int = 600,
+    verbose: bool = False,
+    cache_ttl: int = DEFAULT_CACHE_TTL,
+    use_cache: bool = False,
+    force_refresh: bool = False,
+    poller: RunPoller | None = None
+) -> list[dict]:
+    """
+    Run an Apify actor and wait for results.
+
+    Args:
+        actor_id: The Apify actor ID
+        input_params: Input parameters for the actor
+        api_key: Apify API key
+        timeout_secs: Maximum time to wait for completion
+        verbose: Print progress updates
+        cache_ttl: Seconds a cached result for the same input stays fresh
+        use_cache: Read and write the local result cache (off by default;
+            only enable it for actors without side effects)
+        force_refresh: Ignore any cached result but still store the new one
+        poller: Shared RunPoller when running several actors concurrently
+
+    Returns:
+        List of result items from the actor's dataset
+    """
+    return [
+        item async for item in stream_actor(
+            actor_id, input_params, api_key, timeout_secs, verbose,
+            cache_ttl, use_cache, force_refresh, poller
+        )
+    ]
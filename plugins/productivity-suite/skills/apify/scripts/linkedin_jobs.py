@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["aiohttp>=3.9.0"]
+# dependencies = ["aiohttp>=3.9.0", "orjson>=3.9", "zstandard>=0.22", "python-dotenv>=1.0", "uvloop>=0.19; sys_platform != 'win32'"]
 # ///
 """
 LinkedIn Jobs Search using Apify.
@@ -19,51 +19,26 @@ Usage:
 """
 
 import argparse
-import asyncio
-import json
-import os
+import re
 import sys
+from contextlib import aclosing
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import AsyncIterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+from apify_client import stream_actor, close_session, dump_json, get_api_key, run_main
 
 
 # Actor details
 ACTOR_ID = "vIGxjRrHqDTPuE6M4"
 ACTOR_NAME = "fantastic-jobs/advanced-linkedin-job-search-api"
-APIFY_API_BASE = "https://api.apify.com/v2"
-
 
-def load_env_file() -> None:
-    """Load .env from multiple locations."""
-    locations = [
-        Path.cwd() / ".env",
-        Path(__file__).parent.parent.parent.parent / ".env",
-        Path.home() / "Coding" / "The Crucible" / ".env",
-        Path.home() / "Coding" / "1. General Work" / "The Crucible" / ".env",
-    ]
-
-    for loc in locations:
-        if loc.exists():
-            with open(loc) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip().strip('"\''))
-            break
-
-
-def get_api_key() -> str:
-    """Get Apify API key from environment."""
-    load_env_file()
-    key = os.environ.get("APIFY_API_KEY")
-    if not key:
-        print("Error: APIFY_API_KEY not found in environment", file=sys.stderr)
-        print("Set it in your .env file or export it", file=sys.stderr)
-        sys.exit(1)
-    return key
+# Company size tokens: "11-50", "1001+" or a bare "50"
+_SIZE_RE = re.compile(r"(\d+)(?:-(\d+))?(\+)?")
 
 
-async def search_linkedin_jobs(
+async def iter_linkedin_jobs(
     query: str,
     location: str | None = None,
     company_sizes: list[str] | None = None,
@@ -73,10 +48,12 @@ async def search_linkedin_jobs(
     job_types: list[str] | None = None,
     max_results: int = 100,
     api_key: str = None,
-    verbose: bool = False
-) -> list[dict]:
+    verbose: bool = False,
+    use_cache: bool = True,
+    force_refresh: bool = False
+) -> AsyncIterator[dict]:
     """
-    Search LinkedIn for job postings.
+    Search LinkedIn for job postings, yielding them as they stream in.
 
     Args:
         query: Job title to search for
@@ -89,12 +66,12 @@ async def search_linkedin_jobs(
         max_results: Maximum results to return
         api_key: Apify API key
         verbose: Print progress
+        use_cache: Reuse results of an identical search from the last day
+        force_refresh: Ignore cached results but still cache the new ones
 
-    Returns:
-        List of job postings with company information
+    Yields:
+        Job postings with company information
     """
-    import aiohttp
-
     if not api_key:
         api_key = get_api_key()
 
@@ -112,17 +89,16 @@ async def search_linkedin_jobs(
 
     if company_sizes:
         # Parse company sizes into min/max employees
-        # Format: "21-50,51-200" -> find min and max
+        # Format: "21-50,51-200" -> find min and max; "N+" is capped at N * 10
         all_sizes = []
-        for size in company_sizes:
-            if "-" in size:
-                parts = size.split("-")
-                all_sizes.extend([int(p) for p in parts if p.isdigit()])
-            elif size.endswith("+"):
-                all_sizes.append(int(size.replace("+", "")))
+        for match in _SIZE_RE.finditer(",".join(company_sizes)):
+            low, high, open_ended = match.groups()
+            low = int(low)
+            all_sizes.append(low)
+            all_sizes.append(int(high) if high else low * 10 if open_ended else low)
         if all_sizes:
             input_params["organizationEmployeesGte"] = min(all_sizes)
-            input_params["organizationEmployeesLte"] = max(all_sizes) if max(all_sizes) != min(all_sizes) else max(all_sizes) * 10
+            input_params["organizationEmployeesLte"] = max(all_sizes)
 
     if industries:
         input_params["industryFilter"] = industries if isinstance(industries, list) else [industries]
@@ -143,66 +119,138 @@ async def search_linkedin_jobs(
     if job_types:
         input_params["EmploymentTypeFilter"] = job_types
 
-    headers = {"Content-Type": "application/json"}
+    if verbose:
+        print(f"Searching LinkedIn Jobs for: {query}", file=sys.stderr)
 
-    async with aiohttp.ClientSession() as session:
-        # Start the actor run
-        run_url = f"{APIFY_API_BASE}/acts/{ACTOR_ID}/runs?token={api_key}"
+    async with aclosing(stream_actor(
+        ACTOR_ID, input_params, api_key,
+        timeout_secs=600,
+        verbose=verbose,
+        use_cache=use_cache,
+        force_refresh=force_refresh
+    )) as jobs:
+        async for job in jobs:
+            yield job
 
-        if verbose:
-            print(f"Searching LinkedIn Jobs for: {query}", file=sys.stderr)
-            print(f"Input: {json.dumps(input_params, indent=2)}", file=sys.stderr)
 
-        async with session.post(run_url, headers=headers, json=input_params) as resp:
-            if resp.status != 201:
-                error_text = await resp.text()
-                raise Exception(f"Failed to start actor: {resp.status} - {error_text}")
+async def search_linkedin_jobs(
+    query: str,
+    location: str | None = None,
+    company_sizes: list[str] | None = None,
+    industries: list[str] | None = None,
+    posted_within: str = "month",
+    experience_levels: list[str] | None = None,
+    job_types: list[str] | None = None,
+    max_results: int = 100,
+    api_key: str = None,
+    verbose: bool = False,
+    use_cache: bool = True,
+    force_refresh: bool = False
+) -> list[dict]:
+    """
+    Search LinkedIn for job postings.
 
-            run_data = await resp.json()
-            run_id = run_data["data"]["id"]
+    Args:
+        query: Job title to search for
+        location: Geographic location filter
+        company_sizes: List of company size ranges (e.g., ["11-50", "51-200"])
+        industries: List of industries to filter
+        posted_within: Time filter (day, week, month)
+        experience_levels: Experience levels (entry, associate, mid_senior, director, executive)
+        job_types: Job types (full_time, part_time, contract, temporary, internship)
+        max_results: Maximum results to return
+        api_key: Apify API key
+        verbose: Print progress
+        use_cache: Reuse results of an identical search from the last day
+        force_refresh: Ignore cached results but still cache the new ones
 
-            if verbose:
-                print(f"Run started: {run_id}", file=sys.stderr)
+    Returns:
+        List of job postings with company information
+    """
+    results = [
+        job async for job in iter_linkedin_jobs(
+            query, location, company_sizes, industries, posted_within,
+            experience_levels, job_types, max_results, api_key, verbose,
+            use_cache, force_refresh
+        )
+    ]
 
-        # Poll for completion
-        status_url = f"{APIFY_API_BASE}/actor-runs/{run_id}?token={api_key}"
-        elapsed = 0
-        poll_interval = 5
-        timeout_secs = 600
+    if verbose:
+        print(f"Found {len(results)} job postings", file=sys.stderr)
 
-        while elapsed < timeout_secs:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+    return results
 
-            async with session.get(status_url) as resp:
-                status_data = await resp.json()
-                status = status_data["data"]["status"]
 
-                if verbose:
-                    print(f"Status: {status} ({elapsed}s elapsed)", file=sys.stderr)
+@dataclass(slots=True)
+class Company:
+    """A hiring company, built up from its job postings."""
+    company_name: str
+    company_url: str = ""
+    company_linkedin: str = ""
+    industry: str = ""
+    company_size: str = ""
+    employee_count: int | str = ""
+    location: str = ""
+    description: str = ""
+    job_titles_hiring: dict[str, None] = field(default_factory=dict)  # Ordered set
+    job_descriptions: list[str] = field(default_factory=list)  # For PVP personalization
+    job_count: int = 0
 
-                if status == "SUCCEEDED":
-                    break
-                elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
-                    raise Exception(f"Actor run failed with status: {status}")
+    def to_dict(self) -> dict:
+        """Convert to the JSON output shape."""
+        return {**asdict(self), "job_titles_hiring": list(self.job_titles_hiring)}
 
-        if elapsed >= timeout_secs:
-            raise Exception(f"Actor run timed out after {timeout_secs}s")
 
-        # Fetch results
-        dataset_id = status_data["data"]["defaultDatasetId"]
-        dataset_url = f"{APIFY_API_BASE}/datasets/{dataset_id}/items?token={api_key}&format=json"
+class CompanyAccumulator:
+    """
+    Builds the deduplicated company list one job posting at a time.
 
-        async with session.get(dataset_url) as resp:
-            if resp.status != 200:
-                raise Exception(f"Failed to fetch results: {resp.status}")
+    Lets --companies-only consume streamed postings without holding them all.
+    Uses field names from fantastic-jobs/advanced-linkedin-job-search-api.
+    """
 
-            results = await resp.json()
+    def __init__(self):
+        self._companies: dict[str, Company] = {}
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    def add(self, job: dict) -> None:
+        """Record one job posting."""
+        # Primary field is 'organization' in this API
+        company_name = (job.get("organization") or "").strip()
+
+        if not company_name:
+            return
+
+        company = self._companies.get(company_name)
+        if company is None:
+            org_description = job.get("linkedin_org_description") or ""
+            company = self._companies[company_name] = Company(
+                company_name=company_name,
+                company_url=job.get("organization_url", ""),
+                company_linkedin=job.get("linkedin_org_url", ""),
+                industry=job.get("linkedin_org_industry", ""),
+                company_size=job.get("linkedin_org_size", ""),
+                employee_count=job.get("linkedin_org_employees", ""),
+                location=job.get("linkedin_org_headquarters", ""),
+                description=org_description[:200],
+            )
+
+        job_title = job.get("title")
+        if job_title:
+            company.job_titles_hiring[job_title] = None
+
+        # Keep only first 3 job descriptions to avoid bloat
+        job_description = job.get("description_text")
+        if job_description and len(company.job_descriptions) < 3:
+            company.job_descriptions.append(job_description[:500])
 
-            if verbose:
-                print(f"Found {len(results)} job postings", file=sys.stderr)
+        company.job_count += 1
 
-            return results
+    def companies(self) -> list[dict]:
+        """Return the companies seen so far."""
+        return [company.to_dict() for company in self._companies.values()]
 
 
 def extract_companies(job_results: list[dict]) -> list[dict]:
@@ -210,50 +258,11 @@ def extract_companies(job_results: list[dict]) -> list[dict]:
     Extract unique companies from job results.
 
     Returns deduplicated list of companies that are actively hiring.
-    Uses field names from fantastic-jobs/advanced-linkedin-job-search-api.
     """
-    companies = {}
-
+    accumulator = CompanyAccumulator()
     for job in job_results:
-        # Primary field is 'organization' in this API
-        company_name = job.get("organization", "").strip()
-
-        if not company_name:
-            continue
-
-        if company_name not in companies:
-            companies[company_name] = {
-                "company_name": company_name,
-                "company_url": job.get("organization_url", ""),
-                "company_linkedin": job.get("linkedin_org_url", ""),
-                "industry": job.get("linkedin_org_industry", ""),
-                "company_size": job.get("linkedin_org_size", ""),
-                "employee_count": job.get("linkedin_org_employees", ""),
-                "location": job.get("linkedin_org_headquarters", ""),
-                "description": job.get("linkedin_org_description", "")[:200] if job.get("linkedin_org_description") else "",
-                "job_titles_hiring": [],
-                "job_descriptions": [],  # Store job descriptions for PVP personalization
-                "job_count": 0,
-            }
-
-        job_title = job.get("title", "")
-        job_description = job.get("description_text", "")[:500] if job.get("description_text") else ""
-
-        if job_title:
-            companies[company_name]["job_titles_hiring"].append(job_title)
-        if job_description:
-            companies[company_name]["job_descriptions"].append(job_description)
-        companies[company_name]["job_count"] += 1
-
-    # Convert to list and dedupe job titles
-    result = []
-    for company in companies.values():
-        company["job_titles_hiring"] = list(set(company["job_titles_hiring"]))
-        # Keep only first 3 job descriptions to avoid bloat
-        company["job_descriptions"] = company["job_descriptions"][:3]
-        result.append(company)
-
-    return result
+        accumulator.add(job)
+    return accumulator.companies()
 
 
 async def main():
@@ -288,29 +297,55 @@ async def main():
         action="store_true",
         help="Output unique companies only (deduplicated)"
     )
+    parser.add_argument(
+        "--max-companies",
+        type=int,
+        help="Stop as soon as this many unique companies are found (implies --companies-only)"
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the local result cache")
+    parser.add_argument("--force-refresh", action="store_true", help="Ignore cached results and re-run the search")
 
     args = parser.parse_args()
+    if args.max_companies:
+        args.companies_only = True
 
     # Parse comma-separated arguments
     company_sizes = args.company_size.split(",") if args.company_size else None
     industries = args.industries.split(",") if args.industries else None
 
-    try:
-        results = await search_linkedin_jobs(
-            query=args.query,
-            location=args.location,
-            company_sizes=company_sizes,
-            industries=industries,
-            posted_within=args.posted_within,
-            max_results=args.max_results,
-            verbose=args.verbose
-        )
+    search_args = dict(
+        query=args.query,
+        location=args.location,
+        company_sizes=company_sizes,
+        industries=industries,
+        posted_within=args.posted_within,
+        max_results=args.max_results,
+        verbose=args.verbose,
+        use_cache=not args.no_cache,
+        force_refresh=args.force_refresh
+    )
 
-        # Extract companies if requested
+    try:
+        # Extract companies if requested, streaming so only companies are kept
         if args.companies_only:
-            output_data = extract_companies(results)
+            accumulator = CompanyAccumulator()
+            job_count = 0
+            sample_job = None
+            async with aclosing(iter_linkedin_jobs(**search_args)) as jobs:
+                async for job in jobs:
+                    accumulator.add(job)
+                    job_count += 1
+                    sample_job = sample_job or job
+                    # Closing the stream cancels the remaining page downloads
+                    if args.max_companies and len(accumulator) >= args.max_companies:
+                        if args.verbose:
+                            print(f"Reached {args.max_companies} companies, stopping early", file=sys.stderr)
+                        break
+
+            output_data = accumulator.companies()
             if args.verbose:
+                print(f"Found {job_count} job postings", file=sys.stderr)
                 print(f"Extracted {len(output_data)} unique companies", file=sys.stderr)
                 if output_data:
                     print(f"Sample companies:", file=sys.stderr)
@@ -318,28 +353,29 @@ async def main():
                         print(f"  - {company['company_name']} ({company['job_count']} jobs)", file=sys.stderr)
 
             # Warning if no companies extracted
-            if len(results) > 0 and len(output_data) == 0:
+            if job_count > 0 and len(output_data) == 0:
                 print("⚠️ WARNING: Jobs found but no companies extracted!", file=sys.stderr)
                 print("   This may indicate a field mapping issue.", file=sys.stderr)
                 print("   Raw job sample fields:", file=sys.stderr)
-                if results:
-                    print(f"   {list(results[0].keys())}", file=sys.stderr)
+                print(f"   {list(sample_job.keys())}", file=sys.stderr)
         else:
-            output_data = results
+            output_data = await search_linkedin_jobs(**search_args)
 
-        output_json = json.dumps(output_data, indent=2)
+        output_json = dump_json(output_data)
 
         if args.output:
-            Path(args.output).write_text(output_json)
+            Path(args.output).write_bytes(output_json)
             print(f"Results saved to {args.output}", file=sys.stderr)
             print(f"Total: {len(output_data)} {'companies' if args.companies_only else 'jobs'}")
         else:
-            print(output_json)
+            print(output_json.decode())
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(main())
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["aiohttp>=3.9.0"]
+# dependencies = ["aiohttp>=3.9.0", "zstandard>=0.22", "python-dotenv>=1.0", "uvloop>=0.19; sys_platform != 'win32'"]
 # ///
 """
 Search Apify Store for actors.
@@ -15,19 +15,26 @@ Usage:
 """
 
 import argparse
-import asyncio
+import heapq
 import json
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from apify_client import get_session, close_session, cache_key, cache_age, cache_get, cache_put, run_main
 
 
 APIFY_STORE_API = "https://api.apify.com/v2/store"
+STORE_CACHE_TTL = 604800  # 1 week
 
 
 async def search_actors(
     query: str,
     limit: int = 20,
     pricing_filter: str | None = None,
-    verbose: bool = False
+    verbose: bool = False,
+    use_cache: bool = True,
+    force_refresh: bool = False
 ) -> list[dict]:
     """
     Search Apify store for actors.
@@ -37,12 +44,12 @@ async def search_actors(
         limit: Maximum results to return
         pricing_filter: Filter by pricing type (pay_per_result, pay_per_event, etc.)
         verbose: Print verbose output
+        use_cache: Reuse store results for the same query from the last week
+        force_refresh: Ignore cached results but still cache the new ones
 
     Returns:
         List of matching actors with their details
     """
-    import aiohttp
-
     params = {
         "search": query,
         "limit": limit,
@@ -52,7 +59,11 @@ async def search_actors(
     if verbose:
         print(f"Searching Apify store for: {query}", file=sys.stderr)
 
-    async with aiohttp.ClientSession() as session:
+    key = cache_key("store", params)
+    actors = cache_get(key, STORE_CACHE_TTL) if use_cache and not force_refresh else None
+
+    if actors is None:
+        session = await get_session()
         async with session.get(APIFY_STORE_API, params=params) as resp:
             if resp.status != 200:
                 error = await resp.text()
@@ -61,6 +72,11 @@ async def search_actors(
             data = await resp.json()
             actors = data.get("data", {}).get("items", [])
 
+        if use_cache:
+            cache_put(key, actors)
+    else:
+        print(f"Served from cache (age {cache_age(key):.0f}s); use --force-refresh to search again", file=sys.stderr)
+
     # Process and filter results
     results = []
     for actor in actors:
@@ -73,25 +89,28 @@ async def search_actors(
             if filter_lower not in pricing_lower and pricing_lower != filter_lower:
                 continue
 
+        name = actor.get("name", "")
+        username = actor.get("username", "")
+        description = actor.get("description") or ""
+        stats = actor.get("stats") or {}
+
         result = {
-            "name": actor.get("name", ""),
+            "name": name,
             "title": actor.get("title", ""),
-            "username": actor.get("username", ""),
+            "username": username,
             "actor_id": actor.get("id", ""),
-            "description": actor.get("description", "")[:200] + "..." if actor.get("description", "") and len(actor.get("description", "")) > 200 else actor.get("description", ""),
+            "description": description[:200] + "..." if len(description) > 200 else description,
             "pricing_model": pricing_model,
             "stats": {
-                "runs": actor.get("stats", {}).get("totalRuns", 0),
-                "users": actor.get("stats", {}).get("totalUsers", 0),
+                "runs": stats.get("totalRuns", 0),
+                "users": stats.get("totalUsers", 0),
             },
-            "url": f"https://apify.com/{actor.get('username', '')}/{actor.get('name', '')}",
+            "url": f"https://apify.com/{username}/{name}",
         }
         results.append(result)
 
-    # Sort by usage (most popular first)
-    results.sort(key=lambda x: x["stats"]["runs"], reverse=True)
-
-    return results
+    # Most popular first
+    return heapq.nlargest(limit, results, key=lambda x: x["stats"]["runs"])
 
 
 def format_results(actors: list[dict], detailed: bool = False) -> str:
@@ -134,6 +153,8 @@ async def main():
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
     parser.add_argument("--detailed", "-d", action="store_true", help="Show descriptions")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the local result cache")
+    parser.add_argument("--force-refresh", action="store_true", help="Ignore cached results and search again")
 
     args = parser.parse_args()
 
@@ -142,7 +163,9 @@ async def main():
             query=args.query,
             limit=args.limit,
             pricing_filter=args.pricing,
-            verbose=args.verbose
+            verbose=args.verbose,
+            use_cache=not args.no_cache,
+            force_refresh=args.force_refresh
         )
 
         if args.json:
@@ -153,7 +176,9 @@ async def main():
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(main())
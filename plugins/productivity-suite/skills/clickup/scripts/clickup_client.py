@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["requests>=2.28.0", "python-dotenv>=1.0.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "python-dotenv>=1.0.0", "orjson>=3.9"]
 # ///
 """
 ClickUp API Client
@@ -10,16 +10,147 @@ Core client for interacting with ClickUp API.
 Handles authentication, workspace hierarchy navigation, and task operations.
 """
 
+import atexit
+import hashlib
+import json
 import os
 import sys
-import requests
+import time
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache, partial
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator
 from pathlib import Path
 
-from dotenv import load_dotenv
-env_path = Path(__file__).parents[4] / '.env'
-load_dotenv(env_path)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def _load_env() -> None:
+    """Load the plugin .env, unless the API key is already in the environment."""
+    if os.getenv("CLICKUP_API_KEY"):
+        return
+    from dotenv import load_dotenv
+    env_path = Path(__file__).parents[4] / '.env'
+    load_dotenv(env_path)
+
+
+def dump_json(data) -> str:
+    """Serialize output as indented JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+# Query-string values for boolean params
+_BOOL = {True: "true", False: "false"}
+
+# Cache lifetimes: the space/folder/list hierarchy rarely changes,
+# task listings do
+HIERARCHY_TTL = 300
+TASKS_TTL = 60
+
+# Hierarchy entries persist here between CLI runs, one section per API key
+CACHE_DIR = Path.home() / ".cache" / "clickup-plugin"
+HIERARCHY_CACHE_FILE = CACHE_DIR / "hierarchy.json"
+TASKS_CACHE_PREFIX = "GET:/list/"
+
+# Rate limits and transient 5xx are retried with exponential backoff
+# (or Retry-After, if longer); POST is never retried
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Backoff before retry `attempt`, or the server's Retry-After if longer."""
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        retry_after = 0.0
+    return max(retry_after, RETRY_BACKOFF * 2 ** attempt)
+
+
+def _name_matches(items: List[Dict], query: str) -> List[int]:
+    """Indexes of the items whose name contains query, case-insensitively."""
+    needle = query.casefold()
+    names = [item.get("name", "") for item in items]
+    return [i for i, name in enumerate(names) if needle in name.casefold()]
+
+
+def _find_by_name(items: List[Dict], query: str) -> Optional[Dict]:
+    """First item whose name contains query, case-insensitively."""
+    needle = query.casefold()
+    for item in items:
+        if needle in item.get("name", "").casefold():
+            return item
+    return None
+
+
+@lru_cache(maxsize=4096)
+def ms_to_date(ms: int) -> str:
+    """Format a ClickUp millisecond timestamp as a local date."""
+    return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d")
+
+
+@lru_cache(maxsize=4096)
+def _ms_to_datetime(ms: int) -> str:
+    """Format a ClickUp millisecond timestamp as a local date and time."""
+    return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M")
+
+
+class _TTLCache:
+    """In-memory cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.time() + ttl, value)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry whose key starts with prefix (all by default)."""
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            self._entries.pop(key, None)
+
+    def cleanup(self) -> None:
+        """Drop expired entries."""
+        now = time.time()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            self._entries.pop(key, None)
+
+    def dump(self, skip_prefix: str = "") -> Dict[str, list]:
+        """Unexpired entries as {key: [expires_at, value]}, minus skip_prefix keys."""
+        now = time.time()
+        return {
+            key: [expires_at, value]
+            for key, (expires_at, value) in self._entries.items()
+            if expires_at >= now and not (skip_prefix and key.startswith(skip_prefix))
+        }
+
+    def load(self, entries: Dict[str, list]) -> None:
+        """Add the unexpired entries of a dump(); expiry times are kept."""
+        now = time.time()
+        for key, (expires_at, value) in entries.items():
+            if expires_at >= now:
+                self._entries[key] = (expires_at, value)
 
 
 class ClickUpClient:
@@ -27,8 +158,16 @@ class ClickUpClient:
 
     BASE_URL = "https://api.clickup.com/api/v2"
 
+    # Concurrent requests when fanning out over the hierarchy; kept
+    # modest to stay clear of ClickUp's rate limits
+    MAX_WORKERS = 10
+
+    # Tasks per page returned by GET /list/{id}/task
+    TASK_PAGE_SIZE = 100
+
     def __init__(self):
         """Initialize the ClickUp client with API key from environment."""
+        _load_env()
         self.api_key = os.getenv("CLICKUP_API_KEY")
         if not self.api_key:
             raise ValueError("CLICKUP_API_KEY not found in environment variables")
@@ -38,35 +177,138 @@ class ClickUpClient:
             "Content-Type": "application/json"
         }
 
+        # One pooled client so keep-alive reuses connections across the
+        # hierarchy walk; over HTTP/2, concurrent requests from _gather
+        # share a single TLS connection. Failed connects are retried.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=MAX_RETRIES,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60)
+        )
+        self.session = httpx.Client(headers=self.headers, transport=transport, timeout=30.0)
+
         self._workspace_id: Optional[str] = None
+        self._cache = _TTLCache()
+
+        # Each CLI run is a fresh process: reuse the hierarchy lookups of
+        # recent runs and save this run's on exit
+        self._cache_section = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+        self._loaded_entries: Dict[str, list] = {}
+        self._load_hierarchy_cache()
+        atexit.register(self._save_hierarchy_cache)
 
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
-        """Make an API request to ClickUp."""
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        allowed_statuses: tuple = ()
+    ) -> Dict:
+        """
+        Make an API request to ClickUp.
+
+        HTTP errors with a status in allowed_statuses are still raised, but
+        not reported on stderr; the caller expects and handles them.
+        """
         url = f"{self.BASE_URL}{endpoint}"
 
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if method == "GET":
+            kwargs = {"params": params}
+        elif method == "DELETE":
+            kwargs = {}
+        else:
+            kwargs = {"json": data}
+
         try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
-            elif method == "PUT":
-                response = requests.put(url, headers=self.headers, json=data)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            for attempt in range(MAX_RETRIES + 1):
+                response = self.session.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES or method == "POST" or attempt == MAX_RETRIES:
+                    break
+                time.sleep(_retry_delay(response, attempt))
 
             response.raise_for_status()
-            return response.json() if response.text else {}
+            # Parse the raw bytes: skips text decoding
+            return _loads(response.content) if response.content else {}
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in allowed_statuses:
+                raise
             print(f"HTTP Error: {e}", file=sys.stderr)
             print(f"Response: {e.response.text}", file=sys.stderr)
             raise
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             print(f"Request Error: {e}", file=sys.stderr)
             raise
 
+    def _get_cached(self, endpoint: str, params: Optional[Dict] = None, ttl: float = HIERARCHY_TTL) -> Dict:
+        """GET through the TTL cache, keyed by endpoint and params."""
+        key = f"GET:{endpoint}:{sorted(params.items()) if params else ''}"
+        result = self._cache.get(key)
+        if result is None:
+            result = self._request("GET", endpoint, params=params)
+            self._cache.set(key, result, ttl)
+        return result
+
+    def _gather(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """Run independent API calls concurrently; results come back in call order."""
+        if len(calls) < 2:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(calls))) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
+    def _iter_gather(self, calls: List[Callable[[], Any]]) -> Iterator[Any]:
+        """
+        Like _gather, but yield each result in call order as it is ready.
+
+        Closing the generator early cancels the calls that have not started.
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            futures = [pool.submit(call) for call in calls]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _load_hierarchy_cache(self) -> None:
+        """Seed the TTL cache from the on-disk hierarchy cache, if any."""
+        try:
+            sections = _loads(HIERARCHY_CACHE_FILE.read_bytes())
+            entries = sections.get(self._cache_section) or {}
+            self._cache.load(entries)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        self._loaded_entries = self._cache.dump(skip_prefix=TASKS_CACHE_PREFIX)
+
+    def _save_hierarchy_cache(self) -> None:
+        """Write this client's unexpired hierarchy entries back to disk."""
+        entries = self._cache.dump(skip_prefix=TASKS_CACHE_PREFIX)
+        if entries == self._loaded_entries:
+            return
+
+        try:
+            sections = _loads(HIERARCHY_CACHE_FILE.read_bytes())
+            if not isinstance(sections, dict):
+                sections = {}
+        except (OSError, ValueError):
+            sections = {}
+        sections[self._cache_section] = entries
+
+        tmp = HIERARCHY_CACHE_FILE.with_name(f"{HIERARCHY_CACHE_FILE.name}.{os.getpid()}.tmp")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            payload = orjson.dumps(sections) if orjson is not None else json.dumps(sections).encode()
+            tmp.write_bytes(payload)
+            os.replace(tmp, HIERARCHY_CACHE_FILE)
+        except OSError:
+            pass
+        self._loaded_entries = entries
+
     # ===== WORKSPACE OPERATIONS =====
 
     def get_workspace_id(self) -> str:
@@ -74,7 +316,7 @@ class ClickUpClient:
         if self._workspace_id:
             return self._workspace_id
 
-        result = self._request("GET", "/team")
+        result = self._get_cached("/team")
         teams = result.get("teams", [])
         if not teams:
             raise ValueError("No workspaces found for this API key")
@@ -84,55 +326,52 @@ class ClickUpClient:
 
     def get_workspaces(self) -> List[Dict]:
         """Get all workspaces (teams) accessible to the API key."""
-        result = self._request("GET", "/team")
-        return result.get("teams", [])
+        result = self._get_cached("/team")
+        return list(result.get("teams", []))
 
     # ===== SPACE OPERATIONS =====
 
     def list_spaces(self, archived: bool = False) -> List[Dict]:
         """List all spaces in the workspace."""
         workspace_id = self.get_workspace_id()
-        params = {"archived": str(archived).lower()}
-        result = self._request("GET", f"/team/{workspace_id}/space", params=params)
-        return result.get("spaces", [])
+        params = {"archived": _BOOL[archived]}
+        result = self._get_cached(f"/team/{workspace_id}/space", params)
+        return list(result.get("spaces", []))
 
     def get_space(self, space_id: str) -> Optional[Dict]:
         """Get a specific space by ID."""
         try:
-            return self._request("GET", f"/space/{space_id}")
-        except:
-            return None
+            return self._request("GET", f"/space/{space_id}", allowed_statuses=(404,))
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
     def find_space_by_name(self, name: str) -> Optional[Dict]:
         """Find a space by name (case-insensitive partial match)."""
         spaces = self.list_spaces()
-        name_lower = name.lower()
-        for space in spaces:
-            if name_lower in space.get("name", "").lower():
-                return space
-        return None
+        return _find_by_name(spaces, name)
 
     # ===== FOLDER OPERATIONS =====
 
     def list_folders(self, space_id: str, archived: bool = False) -> List[Dict]:
         """List folders in a space."""
-        params = {"archived": str(archived).lower()}
-        result = self._request("GET", f"/space/{space_id}/folder", params=params)
-        return result.get("folders", [])
-
-    def find_folder_by_name(self, space_id: str, name: str) -> Optional[Dict]:
-        """Find a folder by name within a space."""
-        folders = self.list_folders(space_id)
-        name_lower = name.lower()
-        for folder in folders:
-            if name_lower in folder.get("name", "").lower():
-                return folder
-        return None
+        params = {"archived": _BOOL[archived]}
+        result = self._get_cached(f"/space/{space_id}/folder", params)
+        return list(result.get("folders", []))
+
+    def find_folder_by_name(self, space_id: str, name: str, folders: Optional[List[Dict]] = None) -> Optional[Dict]:
+        """Find a folder by name within a space, optionally in already fetched folders."""
+        if folders is None:
+            folders = self.list_folders(space_id)
+        return _find_by_name(folders, name)
 
     def find_folder_across_spaces(self, name: str) -> Optional[tuple]:
         """Find a folder by name across all spaces. Returns (folder, space_id)."""
-        for space in self.list_spaces():
-            folder = self.find_folder_by_name(space["id"], name)
+        spaces = self.list_spaces()
+        space_folders = self._gather([partial(self.list_folders, space["id"]) for space in spaces])
+        for space, folders in zip(spaces, space_folders):
+            folder = self.find_folder_by_name(space["id"], name, folders=folders)
             if folder:
                 return folder, space["id"]
         return None
@@ -141,39 +380,90 @@ class ClickUpClient:
 
     def list_lists_in_folder(self, folder_id: str, archived: bool = False) -> List[Dict]:
         """List all lists within a folder."""
-        params = {"archived": str(archived).lower()}
-        result = self._request("GET", f"/folder/{folder_id}/list", params=params)
-        return result.get("lists", [])
+        params = {"archived": _BOOL[archived]}
+        result = self._get_cached(f"/folder/{folder_id}/list", params)
+        return list(result.get("lists", []))
 
     def list_lists_in_space(self, space_id: str, archived: bool = False) -> List[Dict]:
         """List folderless lists directly in a space."""
-        params = {"archived": str(archived).lower()}
-        result = self._request("GET", f"/space/{space_id}/list", params=params)
-        return result.get("lists", [])
+        params = {"archived": _BOOL[archived]}
+        result = self._get_cached(f"/space/{space_id}/list", params)
+        return list(result.get("lists", []))
 
     def find_list_by_name(self, name: str, space_id: Optional[str] = None, folder_id: Optional[str] = None) -> Optional[Dict]:
         """Find a list by name. Searches within provided scope."""
-        lists = []
-
         if folder_id:
             lists = self.list_lists_in_folder(folder_id)
-        elif space_id:
-            folders = self.list_folders(space_id)
-            for folder in folders:
-                lists.extend(self.list_lists_in_folder(folder["id"]))
-            lists.extend(self.list_lists_in_space(space_id))
         else:
-            for space in self.list_spaces():
-                folders = self.list_folders(space["id"])
-                for folder in folders:
-                    lists.extend(self.list_lists_in_folder(folder["id"]))
-                lists.extend(self.list_lists_in_space(space["id"]))
-
-        name_lower = name.lower()
-        for lst in lists:
-            if name_lower in lst.get("name", "").lower():
-                return lst
-        return None
+            lists = self._collect_all_lists(space_id)
+
+        return _find_by_name(lists, name)
+
+    def _collect_all_lists(self, space_id: Optional[str] = None) -> List[Dict]:
+        """Every list in a space, or in the whole workspace; folder lists first."""
+        spaces = [{"id": space_id}] if space_id else self.list_spaces()
+        return [lst for lst, _ in self._lists_in_spaces(spaces, folderless_first=False)]
+
+    def _lists_in_spaces(self, spaces: List[Dict], folderless_first: bool = True) -> List[tuple]:
+        """
+        All lists in the given spaces, as (list, space) pairs.
+
+        Fetches one hierarchy level at a time with each level's requests
+        in parallel: folderless lists and folders for every space, then
+        the lists of every folder. Within each space, folderless lists
+        come before or after the folder lists as requested.
+        """
+        level = self._gather(
+            [partial(self.list_lists_in_space, space["id"]) for space in spaces]
+            + [partial(self.list_folders, space["id"]) for space in spaces]
+        )
+        space_lists, space_folders = level[:len(spaces)], level[len(spaces):]
+
+        folder_lists = iter(self._gather([
+            partial(self.list_lists_in_folder, folder["id"])
+            for folders in space_folders
+            for folder in folders
+        ]))
+
+        pairs = []
+        for space, lists, folders in zip(spaces, space_lists, space_folders):
+            if folderless_first:
+                pairs.extend((lst, space) for lst in lists)
+            for _ in folders:
+                pairs.extend((lst, space) for lst in next(folder_lists))
+            if not folderless_first:
+                pairs.extend((lst, space) for lst in lists)
+        return pairs
+
+    def get_hierarchy(self, spaces: List[Dict], with_lists: bool = True) -> List[Dict]:
+        """
+        Folders (and optionally lists) of each space, in space order.
+
+        Each entry has "folders" and, with lists, "folderless_lists"; each
+        folder then carries its own "lists". Every hierarchy level is
+        fetched with its requests in parallel.
+        """
+        calls = [partial(self.list_folders, space["id"]) for space in spaces]
+        if with_lists:
+            calls += [partial(self.list_lists_in_space, space["id"]) for space in spaces]
+        level = self._gather(calls)
+        space_folders = level[:len(spaces)]
+
+        if not with_lists:
+            return [{"folders": folders} for folders in space_folders]
+
+        folder_lists = iter(self._gather([
+            partial(self.list_lists_in_folder, folder["id"])
+            for folders in space_folders
+            for folder in folders
+        ]))
+        return [
+            {
+                "folders": [dict(folder, lists=next(folder_lists)) for folder in folders],
+                "folderless_lists": lists
+            }
+            for folders, lists in zip(space_folders, level[len(spaces):])
+        ]
 
     # ===== TASK OPERATIONS =====
 
@@ -186,77 +476,140 @@ class ClickUpClient:
         include_closed: bool = False
     ) -> List[Dict]:
         """List tasks in a list."""
+        # Pin the lean payload options: no subtasks, no markdown copy of
+        # each description (the API has no general field selection)
         params = {
-            "archived": str(archived).lower(),
+            "archived": _BOOL[archived],
             "page": page,
-            "include_closed": str(include_closed).lower()
+            "include_closed": _BOOL[include_closed],
+            "subtasks": "false",
+            "include_markdown_description": "false"
         }
 
         if statuses:
             params["statuses[]"] = statuses
 
-        result = self._request("GET", f"/list/{list_id}/task", params=params)
-        return result.get("tasks", [])
+        result = self._get_cached(f"/list/{list_id}/task", params, ttl=TASKS_TTL)
+        return list(result.get("tasks", []))
+
+    def iter_tasks(
+        self,
+        list_id: str,
+        archived: bool = False,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False
+    ) -> Iterator[Dict]:
+        """Yield every task in a list, fetching each page only when it is reached."""
+        page = 0
+        while True:
+            tasks = self.list_tasks(list_id, archived, page, statuses, include_closed)
+            yield from tasks
+            if len(tasks) < self.TASK_PAGE_SIZE:
+                return
+            page += 1
 
     def get_task(self, task_id: str, include_subtasks: bool = False) -> Optional[Dict]:
         """Get a specific task by ID."""
-        params = {"include_subtasks": str(include_subtasks).lower()}
+        params = {
+            "include_subtasks": _BOOL[include_subtasks],
+            "include_markdown_description": "false"
+        }
         try:
-            return self._request("GET", f"/task/{task_id}", params=params)
-        except:
-            return None
+            return self._request("GET", f"/task/{task_id}", params=params, allowed_statuses=(404,))
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
-    def search_tasks(self, query: str, space_id: Optional[str] = None) -> List[Dict]:
+    def search_tasks(self, query: str, space_id: Optional[str] = None, limit: Optional[int] = 10) -> List[Dict]:
         """
         Search tasks by name across workspace or within a space.
 
-        Note: ClickUp lacks a direct search endpoint, so this iterates through lists.
-        For better performance, provide a space_id to narrow the search.
+        Stops once `limit` matches are found (None for all matches).
+
+        Note: ClickUp lacks a direct search endpoint, so this iterates through lists,
+        fetching each hierarchy level concurrently. For better performance,
+        provide a space_id to narrow the search.
         """
-        query_lower = query.lower()
         matching_tasks = []
 
+        matches = self._iter_search_matches(query, space_id)
+        with closing(matches):
+            for task, lst, space in matches:
+                task["_list_name"] = lst.get("name", "")
+                task["_space_name"] = space.get("name") or ""
+                matching_tasks.append(task)
+                if limit and len(matching_tasks) >= limit:
+                    break
+
+        # The space name is only looked up once something matched
+        if space_id and matching_tasks:
+            space_name = self._space_name(space_id)
+            for task in matching_tasks:
+                task["_space_name"] = space_name
+
+        return matching_tasks
+
+    def search_task_summaries(self, query: str, space_id: Optional[str] = None, limit: Optional[int] = 10) -> List[Dict]:
+        """Like search_tasks, but return task summaries."""
+        extract = self.extract_task_summary
+        return [extract(task) for task in self.search_tasks(query, space_id, limit)]
+
+    def _space_name(self, space_id: str) -> str:
+        space = self.get_space(space_id)
+        return space.get("name", "") if space else ""
+
+    def _iter_search_matches(self, query: str, space_id: Optional[str] = None) -> Iterator[tuple]:
+        """Yield (task, list, space) for tasks whose name contains query."""
         if space_id:
-            spaces = [{"id": space_id, "name": ""}]
-            space_obj = self.get_space(space_id)
-            if space_obj:
-                spaces[0]["name"] = space_obj.get("name", "")
+            spaces = [{"id": space_id, "name": None}]
         else:
             spaces = self.list_spaces()
 
-        for space in spaces:
-            lists = self.list_lists_in_space(space["id"])
-
-            folders = self.list_folders(space["id"])
-            for folder in folders:
-                lists.extend(self.list_lists_in_folder(folder["id"]))
+        lists = self._lists_in_spaces(spaces)
+        task_pages = self._iter_gather([partial(self.list_tasks, lst["id"], include_closed=True) for lst, _ in lists])
 
-            for lst in lists:
-                tasks = self.list_tasks(lst["id"], include_closed=True)
-                for task in tasks:
-                    if query_lower in task.get("name", "").lower():
-                        task["_list_name"] = lst.get("name", "")
-                        task["_space_name"] = space.get("name", "")
-                        matching_tasks.append(task)
-
-        return matching_tasks
+        # Closing task_pages cancels the list fetches not yet started
+        with closing(task_pages):
+            for (lst, space), tasks in zip(lists, task_pages):
+                for i in _name_matches(tasks, query):
+                    yield tasks[i], lst, space
 
     def update_task(self, task_id: str, updates: Dict) -> Dict:
         """Update a task."""
-        return self._request("PUT", f"/task/{task_id}", data=updates)
+        result = self._request("PUT", f"/task/{task_id}", data=updates)
+        # Cached task listings may now be stale
+        self._cache.invalidate(TASKS_CACHE_PREFIX)
+        return result
 
     def update_task_status(self, task_id: str, status: str) -> Dict:
         """Update a task's status."""
         return self.update_task(task_id, {"status": status})
 
+    def update_task_statuses_batch(self, task_ids: List[str], status: str) -> Dict[str, Optional[Exception]]:
+        """
+        Set the same status on several tasks concurrently over the pooled session.
+
+        Returns task ID -> None on success, or the error that update raised.
+        """
+        def update(task_id: str) -> Optional[Exception]:
+            try:
+                self._request("PUT", f"/task/{task_id}", data={"status": status})
+            except httpx.HTTPError as e:
+                return e
+            return None
+
+        errors = self._gather([partial(update, task_id) for task_id in task_ids])
+        # Cached task listings may now be stale
+        self._cache.invalidate(TASKS_CACHE_PREFIX)
+        return dict(zip(task_ids, errors))
+
     # ===== COMMENTS OPERATIONS =====
 
     def get_task_comments(self, task_id: str, start: int = 0) -> List[Dict]:
         """Get comments on a task."""
-        params = {}
-        if start:
-            params["start"] = start
-
+        # ClickUp treats a missing start as 0
+        params = {"start": start} if start else None
         result = self._request("GET", f"/task/{task_id}/comment", params=params)
         return result.get("comments", [])
 
@@ -264,40 +617,49 @@ class ClickUpClient:
 
     def extract_task_summary(self, task: Dict) -> Dict:
         """Extract a clean summary from a task record."""
-        assignees = task.get("assignees", [])
-        assignee_names = [a.get("username", a.get("email", "Unknown")) for a in assignees]
+        get = task.get
 
-        status = task.get("status", {})
-        status_name = status.get("status", "Unknown")
-        status_color = status.get("color", "")
+        assignee_names = [a.get("username", a.get("email", "Unknown")) for a in get("assignees", [])]
 
-        due_date = task.get("due_date")
+        status = get("status", {})
+
+        # Tasks in a sprint often share due dates, so formatting is memoized
+        due_date = get("due_date")
         if due_date:
-            due_date = datetime.fromtimestamp(int(due_date) / 1000).strftime("%Y-%m-%d")
+            due_date = ms_to_date(int(due_date))
 
-        start_date = task.get("start_date")
+        start_date = get("start_date")
         if start_date:
-            start_date = datetime.fromtimestamp(int(start_date) / 1000).strftime("%Y-%m-%d")
+            start_date = ms_to_date(int(start_date))
+
+        priority = get("priority")
 
-        priority = task.get("priority")
-        priority_name = priority.get("priority", "") if priority else ""
+        # Only look at the nested list when search_tasks didn't annotate one
+        list_name = get("_list_name")
+        if list_name is None:
+            list_name = (get("list") or {}).get("name", "")
 
         return {
-            "id": task.get("id", ""),
-            "name": task.get("name", ""),
-            "description": task.get("description", ""),
-            "status": status_name,
-            "status_color": status_color,
+            "id": get("id", ""),
+            "name": get("name", ""),
+            "description": get("description", ""),
+            "status": status.get("status", "Unknown"),
+            "status_color": status.get("color", ""),
             "assignees": assignee_names,
             "due_date": due_date,
             "start_date": start_date,
-            "priority": priority_name,
-            "url": task.get("url", ""),
-            "list_name": task.get("_list_name", task.get("list", {}).get("name", "")),
-            "space_name": task.get("_space_name", ""),
-            "tags": [t.get("name", "") for t in task.get("tags", [])]
+            "priority": priority.get("priority", "") if priority else "",
+            "url": get("url", ""),
+            "list_name": list_name,
+            "space_name": get("_space_name", ""),
+            "tags": [t.get("name", "") for t in get("tags", [])]
         }
 
+    def extract_task_summaries(self, tasks: List[Dict]) -> List[Dict]:
+        """Extract summaries for many tasks in one pass."""
+        extract = self.extract_task_summary
+        return [extract(task) for task in tasks]
+
     def format_space_summary(self, space: Dict) -> Dict:
         """Extract a clean summary from a space record."""
         return {
@@ -311,7 +673,7 @@ class ClickUpClient:
         """Extract a clean summary from a comment record."""
         date = comment.get("date")
         if date:
-            date = datetime.fromtimestamp(int(date) / 1000).strftime("%Y-%m-%d %H:%M")
+            date = _ms_to_datetime(int(date))
 
         user = comment.get("user", {})
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["requests>=2.28.0", "python-dotenv>=1.0.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "python-dotenv>=1.0.0", "orjson>=3.9"]
 # ///
 """
 Read comments on a ClickUp task.
@@ -13,12 +13,11 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from clickup_client import ClickUpClient
+from clickup_client import ClickUpClient, dump_json
 
 
 def format_comment(comment: dict) -> str:
@@ -43,20 +42,19 @@ def main():
         task_id = args.task_id
 
         if args.search and not task_id:
-            tasks = client.search_tasks(args.search)
+            summaries = client.search_task_summaries(args.search)
 
-            if not tasks:
+            if not summaries:
                 print(f"No tasks found matching '{args.search}'")
                 sys.exit(1)
 
-            if len(tasks) > 1:
+            if len(summaries) > 1:
                 print(f"Multiple tasks found. Use task ID directly.")
-                for t in tasks[:5]:
-                    summary = client.extract_task_summary(t)
+                for summary in summaries[:5]:
                     print(f"  - {summary['name']} (ID: {summary['id']})")
                 sys.exit(1)
 
-            task_id = tasks[0]["id"]
+            task_id = summaries[0]["id"]
 
         # Get task info for context
         task = client.get_task(task_id)
@@ -76,7 +74,7 @@ def main():
 
         if args.json:
             formatted = [client.format_comment(c) for c in comments]
-            print(json.dumps(formatted, indent=2))
+            print(dump_json(formatted))
         else:
             print(f"Comments on **{task_summary['name']}** ({len(comments)}):\n")
             for comment in comments:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["requests>=2.28.0", "python-dotenv>=1.0.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "python-dotenv>=1.0.0", "orjson>=3.9"]
 # ///
 """
 List spaces in ClickUp workspace.
@@ -13,12 +13,11 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from clickup_client import ClickUpClient
+from clickup_client import ClickUpClient, dump_json
 
 
 def main():
@@ -33,27 +32,30 @@ def main():
         client = ClickUpClient()
         spaces = client.list_spaces()
 
+        # Crawl the whole hierarchy up front, one parallel batch per level
+        if args.with_folders or args.with_lists:
+            hierarchy = client.get_hierarchy(spaces, with_lists=args.with_lists)
+        else:
+            hierarchy = [{}] * len(spaces)
+
         if args.json:
             output = []
-            for space in spaces:
+            for space, tree in zip(spaces, hierarchy):
                 space_data = client.format_space_summary(space)
                 if args.with_folders or args.with_lists:
-                    folders = client.list_folders(space["id"])
                     space_data["folders"] = []
-                    for f in folders:
+                    for f in tree["folders"]:
                         folder_data = {"id": f["id"], "name": f["name"]}
                         if args.with_lists:
-                            lists = client.list_lists_in_folder(f["id"])
-                            folder_data["lists"] = [{"id": l["id"], "name": l["name"]} for l in lists]
+                            folder_data["lists"] = [{"id": l["id"], "name": l["name"]} for l in f["lists"]]
                         space_data["folders"].append(folder_data)
                     if args.with_lists:
-                        folderless = client.list_lists_in_space(space["id"])
-                        space_data["folderless_lists"] = [{"id": l["id"], "name": l["name"]} for l in folderless]
+                        space_data["folderless_lists"] = [{"id": l["id"], "name": l["name"]} for l in tree["folderless_lists"]]
                 output.append(space_data)
-            print(json.dumps(output, indent=2))
+            print(dump_json(output))
         else:
             print(f"Found {len(spaces)} space(s):\n")
-            for space in spaces:
+            for space, tree in zip(spaces, hierarchy):
                 summary = client.format_space_summary(space)
                 private_badge = " (private)" if summary["private"] else ""
                 print(f"**{summary['name']}**{private_badge}")
@@ -62,18 +64,17 @@ def main():
                     print(f"  Statuses: {', '.join(summary['statuses'])}")
 
                 if args.with_folders or args.with_lists:
-                    folders = client.list_folders(space["id"])
+                    folders = tree["folders"]
                     if folders:
                         print("  Folders:")
                         for folder in folders:
                             print(f"    - {folder['name']} (ID: {folder['id']})")
                             if args.with_lists:
-                                lists = client.list_lists_in_folder(folder["id"])
-                                for lst in lists:
+                                for lst in folder["lists"]:
                                     print(f"        - {lst['name']} (ID: {lst['id']})")
 
                     if args.with_lists:
-                        folderless = client.list_lists_in_space(space["id"])
+                        folderless = tree["folderless_lists"]
                         if folderless:
                             print("  Lists (no folder):")
                             for lst in folderless:
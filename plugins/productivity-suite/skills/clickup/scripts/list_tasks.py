@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["requests>=2.28.0", "python-dotenv>=1.0.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "python-dotenv>=1.0.0", "orjson>=3.9"]
 # ///
 """
 List tasks in ClickUp with filters.
@@ -14,30 +14,36 @@ Usage:
 """
 
 import argparse
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from clickup_client import ClickUpClient
-
-
-def format_task(summary: dict) -> str:
-    """Format a task summary for display."""
-    lines = [f"**{summary['name']}**"]
-    lines.append(f"  Status: {summary['status']}")
-
-    if summary['assignees']:
-        lines.append(f"  Assignees: {', '.join(summary['assignees'])}")
-    if summary['due_date']:
-        lines.append(f"  Due: {summary['due_date']}")
-    if summary['priority']:
-        lines.append(f"  Priority: {summary['priority']}")
-    if summary['list_name']:
-        lines.append(f"  List: {summary['list_name']}")
-    lines.append(f"  ID: {summary['id']}")
-    if summary['url']:
-        lines.append(f"  URL: {summary['url']}")
+from clickup_client import ClickUpClient, dump_json, ms_to_date
+
+
+def format_task_text(task: dict) -> str:
+    """Format a raw task for display, reading only the fields shown."""
+    get = task.get
+    lines = [f"**{get('name', '')}**"]
+    lines.append(f"  Status: {get('status', {}).get('status', 'Unknown')}")
+
+    assignees = get("assignees")
+    if assignees:
+        lines.append(f"  Assignees: {', '.join(a.get('username', a.get('email', 'Unknown')) for a in assignees)}")
+    due_date = get("due_date")
+    if due_date:
+        lines.append(f"  Due: {ms_to_date(int(due_date))}")
+    priority = get("priority")
+    if priority and priority.get("priority"):
+        lines.append(f"  Priority: {priority['priority']}")
+    list_name = (get("list") or {}).get("name")
+    if list_name:
+        lines.append(f"  List: {list_name}")
+    lines.append(f"  ID: {get('id', '')}")
+    if get("url"):
+        lines.append(f"  URL: {task['url']}")
 
     return "\n".join(lines)
 
@@ -104,46 +110,53 @@ def main():
                 lists = client.list_lists_in_folder(folder_id)
                 list_ids = [l["id"] for l in lists]
             elif space_id:
-                lists = client.list_lists_in_space(space_id)
-                list_ids = [l["id"] for l in lists]
-                folders = client.list_folders(space_id)
-                for folder in folders:
-                    for lst in client.list_lists_in_folder(folder["id"]):
-                        list_ids.append(lst["id"])
+                # Folderless lists first, then each folder's lists, fetched in one parallel pass
+                tree = client.get_hierarchy([space])[0]
+                list_ids = [l["id"] for l in tree["folderless_lists"]]
+                for folder in tree["folders"]:
+                    list_ids.extend(l["id"] for l in folder["lists"])
 
         # Fetch tasks from all lists
         status_filter = [args.status] if args.status else None
 
-        for list_id in list_ids:
+        with ThreadPoolExecutor(max_workers=ClickUpClient.MAX_WORKERS) as pool:
+            # Prefetch the first page of every list concurrently; iter_tasks
+            # then reads it from the client cache and pages on lazily
+            prefetch = [
+                pool.submit(client.list_tasks, list_id, statuses=status_filter, include_closed=args.include_closed)
+                for list_id in list_ids
+            ]
             try:
-                list_tasks = client.list_tasks(
-                    list_id,
-                    statuses=status_filter,
-                    include_closed=args.include_closed
-                )
-                for t in list_tasks:
-                    t["_list_id"] = list_id
-                tasks.extend(list_tasks)
-            except Exception as e:
-                print(f"Warning: Could not fetch tasks from list {list_id}: {e}", file=sys.stderr)
-
-            if len(tasks) >= args.limit:
-                break
-
-        tasks = tasks[:args.limit]
+                for list_id, future in zip(list_ids, prefetch):
+                    try:
+                        future.result()
+                        for t in islice(
+                            client.iter_tasks(list_id, statuses=status_filter, include_closed=args.include_closed),
+                            args.limit - len(tasks)
+                        ):
+                            t["_list_id"] = list_id
+                            tasks.append(t)
+                    except Exception as e:
+                        print(f"Warning: Could not fetch tasks from list {list_id}: {e}", file=sys.stderr)
+
+                    if len(tasks) >= args.limit:
+                        break
+            finally:
+                # Lists not reached before the limit are never requested
+                for future in prefetch:
+                    future.cancel()
 
         if not tasks:
             print("No tasks found matching the criteria.")
             return
 
         if args.json:
-            results = [client.extract_task_summary(t) for t in tasks]
-            print(json.dumps(results, indent=2))
+            print(dump_json(client.extract_task_summaries(tasks)))
         else:
+            # Text output skips the full summary and reads raw fields
             print(f"Found {len(tasks)} task(s):\n")
             for task in tasks:
-                summary = client.extract_task_summary(task)
-                print(format_task(summary))
+                print(format_task_text(task))
                 print()
 
     except Exception as e:
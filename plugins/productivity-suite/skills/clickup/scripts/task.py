@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["requests>=2.28.0", "python-dotenv>=1.0.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "python-dotenv>=1.0.0", "orjson>=3.9"]
 # ///
 """
 Get task details from ClickUp.
@@ -12,12 +12,11 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from clickup_client import ClickUpClient
+from clickup_client import ClickUpClient, dump_json
 
 
 def format_task_detail(summary: dict, description: str = "") -> str:
@@ -61,13 +60,13 @@ def main():
 
     try:
         client = ClickUpClient()
-        task = None
 
         if args.task_id:
             task = client.get_task(args.task_id)
             if not task:
                 print(f"Task '{args.task_id}' not found", file=sys.stderr)
                 sys.exit(1)
+            summary = client.extract_task_summary(task)
         else:
             # Search for task
             space_id = None
@@ -76,28 +75,25 @@ def main():
                 if space:
                     space_id = space["id"]
 
-            tasks = client.search_tasks(args.search, space_id=space_id)
+            summaries = client.search_task_summaries(args.search, space_id=space_id)
 
-            if not tasks:
+            if not summaries:
                 print(f"No tasks found matching '{args.search}'")
                 sys.exit(1)
 
-            if len(tasks) > 1:
+            if len(summaries) > 1:
                 print(f"Multiple tasks found matching '{args.search}':\n")
-                for t in tasks[:10]:
-                    summary = client.extract_task_summary(t)
-                    print(f"  - {summary['name']} (ID: {summary['id']}) - {summary['status']}")
+                for s in summaries[:10]:
+                    print(f"  - {s['name']} (ID: {s['id']}) - {s['status']}")
                 print(f"\nUse task ID for exact match: uv run scripts/task.py <id>")
                 sys.exit(0)
 
-            task = tasks[0]
-
-        summary = client.extract_task_summary(task)
+            summary = summaries[0]
 
         if args.json:
-            print(json.dumps(summary, indent=2))
+            print(dump_json(summary))
         else:
-            print(format_task_detail(summary, task.get("description", "")))
+            print(format_task_detail(summary, summary["description"]))
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
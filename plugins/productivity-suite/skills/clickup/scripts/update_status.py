@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["requests>=2.28.0", "python-dotenv>=1.0.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "python-dotenv>=1.0.0", "orjson>=3.9"]
 # ///
 """
 Update task status in ClickUp.
@@ -10,6 +10,7 @@ Usage:
     python update_status.py abc123 --status "complete"
     python update_status.py abc123 --complete
     python update_status.py --search "homepage" --status "in progress"
+    python update_status.py --search "homepage" --complete --all
 """
 
 import argparse
@@ -20,12 +21,33 @@ sys.path.insert(0, str(Path(__file__).parent))
 from clickup_client import ClickUpClient
 
 
+def update_all(client: ClickUpClient, summaries: list, new_status: str) -> None:
+    """Update every matched task concurrently and print a summary."""
+    print(f"Updating {len(summaries)} tasks -> {new_status}\n")
+
+    errors = client.update_task_statuses_batch([s["id"] for s in summaries], new_status)
+
+    failed = 0
+    for s in summaries:
+        error = errors[s["id"]]
+        if error is None:
+            print(f"  - {s['name']} ({s['status']} -> {new_status})")
+        else:
+            failed += 1
+            print(f"  - {s['name']} (ID: {s['id']}) FAILED: {error}")
+
+    print(f"\nDone! {len(summaries) - failed}/{len(summaries)} tasks updated.")
+    if failed:
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Update ClickUp task status")
     parser.add_argument("task_id", nargs="?", help="Task ID")
     parser.add_argument("--search", help="Search for task by name")
     parser.add_argument("--status", help="New status name")
     parser.add_argument("--complete", action="store_true", help="Mark task as complete")
+    parser.add_argument("--all", action="store_true", help="With --search, update every matching task")
 
     args = parser.parse_args()
 
@@ -35,41 +57,46 @@ def main():
     if not args.status and not args.complete:
         parser.error("Must provide --status or --complete")
 
+    if args.all and not args.search:
+        parser.error("--all requires --search")
+
     try:
         client = ClickUpClient()
-        task = None
+        summary = None
         task_id = args.task_id
 
+        # Determine new status
+        new_status = args.status if args.status else "complete"
+
         if args.search and not task_id:
-            tasks = client.search_tasks(args.search)
+            summaries = client.search_task_summaries(args.search, limit=None if args.all else 10)
 
-            if not tasks:
+            if not summaries:
                 print(f"No tasks found matching '{args.search}'")
                 sys.exit(1)
 
-            if len(tasks) > 1:
+            if len(summaries) > 1:
+                if args.all:
+                    update_all(client, summaries, new_status)
+                    return
+
                 print(f"Multiple tasks found matching '{args.search}':\n")
-                for t in tasks[:10]:
-                    summary = client.extract_task_summary(t)
-                    print(f"  - {summary['name']} (ID: {summary['id']}) - {summary['status']}")
-                print(f"\nUse task ID for exact match")
+                for s in summaries[:10]:
+                    print(f"  - {s['name']} (ID: {s['id']}) - {s['status']}")
+                print(f"\nUse task ID for exact match, or --all to update every match")
                 sys.exit(1)
 
-            task = tasks[0]
-            task_id = task["id"]
-
-        # Determine new status
-        new_status = args.status if args.status else "complete"
+            summary = summaries[0]
+            task_id = summary["id"]
 
         # Get current task info
-        if not task:
+        if not summary:
             task = client.get_task(task_id)
+            if not task:
+                print(f"Task '{task_id}' not found", file=sys.stderr)
+                sys.exit(1)
+            summary = client.extract_task_summary(task)
 
-        if not task:
-            print(f"Task '{task_id}' not found", file=sys.stderr)
-            sys.exit(1)
-
-        summary = client.extract_task_summary(task)
         old_status = summary["status"]
 
         print(f"Updating task: {summary['name']}")
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["aiohttp>=3.9.0"]
+# dependencies = [
+#     "aiohttp>=3.9.0",
+#     "orjson>=3.9",  # optional: falls back to json
+#     "uvloop>=0.18; sys_platform != 'win32'",  # optional: falls back to asyncio
+# ]
 # ///
 """
 Fireflies.ai Transcript Extraction
@@ -10,11 +14,17 @@ Fetches meeting transcripts via GraphQL API.
 
 import argparse
 import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import os
+import random
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 try:
     import aiohttp
@@ -22,42 +32,180 @@ except ImportError:
     print("Error: aiohttp not installed. Run: pip install aiohttp")
     sys.exit(1)
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 # Configuration
 API_ENDPOINT = "https://api.fireflies.ai/graphql"
 
-
-def load_env_file(filepath: str = ".env") -> None:
-    """Load environment variables from .env file."""
+# Fallback .env at the project root, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+_DEFAULT_ENV = _PROJECT_ROOT / ".env"
+
+# Transcripts per aliased batch query, and batch queries in flight at once
+TRANSCRIPT_BATCH_SIZE = 10
+MAX_CONCURRENCY = 16
+
+# Retry policy for rate limits and gateway errors
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_JITTER = 0.5
+
+# Finished transcripts don't change, so fetched ones are cached on disk
+CACHE_DIR = Path(os.getenv("FIREFLIES_CACHE_DIR", "~/.cache/fireflies")).expanduser()
+CACHE_TTL = 7 * 86400  # 7 days
+
+# Transcripts kept in memory per process, keyed by (ID, field selection)
+MEMO_SIZE = 256
+
+_api_key: str | None = None
+_session: aiohttp.ClientSession | None = None
+_limiter: "RateLimiter | None" = None
+_apq_disabled = False
+_memo: dict[tuple[str, str], dict] = {}
+_memo_locks: dict[tuple[str, str], list] = {}  # key -> [lock, tasks using it]
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all requests: `rate` requests per second on
+    average, with bursts of up to `burst`. Waits with asyncio.sleep, so
+    other tasks keep running while a request is held back.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. when the server reports no requests remaining."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def load_env_file(filepath: str = ".env") -> dict:
+    """Load environment variables from .env file, once per process."""
     env_path = Path(filepath)
     if not env_path.exists():
-        # Try from project root
-        project_root = Path(__file__).parent.parent.parent.parent.parent
-        env_path = project_root / ".env"
+        env_path = _DEFAULT_ENV
+
+    try:
+        text = env_path.read_text()
+    except FileNotFoundError:
+        return {}
+
+    values = {
+        key.strip(): value.strip().strip('"').strip("'")
+        for line in text.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith('#') and '=' in stripped
+        for key, value in [stripped.split('=', 1)]
+    }
+    os.environ.update(values)
+    return values
 
-    if not env_path.exists():
-        return
 
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                os.environ[key] = value
+def dump_json(data) -> str:
+    """Serialize output as indented JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
 
 
 def get_api_key() -> str:
-    """Get Fireflies API key from environment."""
+    """Get Fireflies API key from environment. Cached after first call."""
+    global _api_key
+    if _api_key:
+        return _api_key
+
     load_env_file()
     api_key = os.getenv("FIREFLIES_API_KEY")
     if not api_key:
         print("Error: FIREFLIES_API_KEY not set in environment or .env file")
         sys.exit(1)
+    _api_key = api_key
     return api_key
 
 
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared keep-alive session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=64,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            headers={
+                "Authorization": f"Bearer {get_api_key()}",
+                "Content-Type": "application/json"
+            },
+        )
+    return _session
+
+
+def get_limiter() -> RateLimiter:
+    """Return the shared rate limiter; FIREFLIES_RPS sets the rate (default 1/s)."""
+    global _limiter
+    if _limiter is None:
+        get_api_key()  # loads .env, which may set FIREFLIES_RPS
+        _limiter = RateLimiter(float(os.getenv("FIREFLIES_RPS", "1")))
+    return _limiter
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Backoff before retry `attempt`: Retry-After if longer, plus jitter."""
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        retry_after = 0.0  # HTTP-date form; fall back to the exponential delay
+    return max(retry_after, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, RETRY_JITTER)
+
+
+async def close_session() -> None:
+    """Close the shared session. Call once before the event loop exits."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
 # GraphQL Queries
 LIST_TRANSCRIPTS_QUERY = """
 query Transcripts($title: String, $fromDate: DateTime, $toDate: DateTime, $limit: Int, $skip: Int, $participants: [String!]) {
@@ -79,53 +227,161 @@ query Transcripts($title: String, $fromDate: DateTime, $toDate: DateTime, $limit
 }
 """
 
-GET_TRANSCRIPT_QUERY = """
-query Transcript($transcriptId: String!) {
-    transcript(id: $transcriptId) {
+# Transcript field fragments; sentences can be megabytes for long meetings
+_DETAIL_FIELDS = """
         id
         title
         dateString
         duration
         participants
         organizer_email
-        transcript_url
+        transcript_url"""
+
+_SENTENCES_FIELDS = """
         sentences {
             speaker_name
             text
             start_time
             end_time
-        }
+        }"""
+
+_SUMMARY_FIELDS = """
         summary {
             overview
             action_items
-        }
-    }
-}
+        }"""
+
+
+def transcript_fields(include_sentences: bool = True, include_summary: bool = True) -> str:
+    """Selection set for a transcript, with or without sentences and summary."""
+    fields = _DETAIL_FIELDS
+    if include_sentences:
+        fields += _SENTENCES_FIELDS
+    if include_summary:
+        fields += _SUMMARY_FIELDS
+    return f"{{{fields}\n    }}"
+
+
+def build_get_query(include_sentences: bool = True, include_summary: bool = True) -> str:
+    """Query fetching one transcript by $transcriptId."""
+    fields = transcript_fields(include_sentences, include_summary)
+    return f"""
+query Transcript($transcriptId: String!) {{
+    transcript(id: $transcriptId) {fields}
+}}
 """
 
 
-async def graphql_request(query: str, variables: dict = None) -> dict:
-    """Execute a GraphQL request against Fireflies API."""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+TRANSCRIPT_FIELDS = transcript_fields()
+GET_TRANSCRIPT_QUERY = build_get_query()
+
+
+def build_batch_query(count: int, fields: str = TRANSCRIPT_FIELDS) -> str:
+    """One query fetching `count` transcripts, aliased t0..tN with variables $id0..$idN."""
+    params = ", ".join(f"$id{i}: String!" for i in range(count))
+    selections = "\n".join(f"    t{i}: transcript(id: $id{i}) {fields}" for i in range(count))
+    return f"query Batch({params}) {{\n{selections}\n}}"
+
+
+@functools.lru_cache(maxsize=None)
+def _query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+# APQ rejections, by message and by extensions.code
+_PERSISTED_QUERY_ERRORS = {
+    "PersistedQueryNotFound": "PERSISTED_QUERY_NOT_FOUND",
+    "PersistedQueryNotSupported": "PERSISTED_QUERY_NOT_SUPPORTED",
+}
+
+
+def _persisted_query_error(body) -> str | None:
+    """The APQ error code if the server rejected the hash itself, else None."""
+    if not isinstance(body, dict):
+        return None
+    for error in body.get("errors") or []:
+        code = _PERSISTED_QUERY_ERRORS.get(error.get("message")) or (error.get("extensions") or {}).get("code")
+        if code in _PERSISTED_QUERY_ERRORS.values():
+            return code
+    return None
+
+
+def _result_data(status: int, body, partial: bool = False) -> dict:
+    if status != 200:
+        raise Exception(f"API error {status}: {body}")
+    errors = body.get("errors")
+    data = body.get("data")
+    if errors:
+        if not (partial and data):
+            raise Exception(f"GraphQL error: {errors}")
+        # Aliased batch: an error (e.g. an unknown ID) only empties its own alias
+        for error in errors:
+            path = error.get("path") or []
+            if path:
+                data[path[0]] = None
+    return data or {}
+
+
+async def graphql_request(query: str, variables: dict = None, partial: bool = False) -> dict:
+    """
+    Execute a GraphQL request against Fireflies API.
+
+    With partial, a response carrying both data and errors returns the data,
+    with each failed top-level field set to None, instead of raising.
+
+    With FIREFLIES_APQ=1, the query is first sent as an Automatic Persisted
+    Query hash. On a cache miss the full query is sent along with the hash so
+    the server can register it. If the server doesn't support APQ (or rejects
+    the request outright with a 400), APQ is turned off for the rest of the
+    process and the full query is sent. Any other response, including
+    ordinary GraphQL errors, is handled as usual.
+    """
+    global _apq_disabled
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(API_ENDPOINT, headers=headers, json=payload) as response:
-            if response.status != 200:
-                text = await response.text()
-                raise Exception(f"API error {response.status}: {text}")
-
-            result = await response.json()
-            if "errors" in result:
-                raise Exception(f"GraphQL error: {result['errors']}")
-
-            return result.get("data", {})
+    get_api_key()  # loads .env, which may set FIREFLIES_APQ
+    if not _apq_disabled and os.getenv("FIREFLIES_APQ") == "1":
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": _query_hash(query)}}
+        status, body = await _post({"variables": variables or {}, "extensions": extensions})
+        error = _persisted_query_error(body)
+        if error == "PERSISTED_QUERY_NOT_FOUND":
+            payload["extensions"] = extensions
+        elif error or status == 400:
+            _apq_disabled = True
+        else:
+            return _result_data(status, body, partial)
+
+    return _result_data(*await _post(payload), partial)
+
+
+async def _post(payload: dict) -> tuple[int, dict | str]:
+    """
+    POST a payload, rate limited and retried on 429/5xx.
+
+    Returns the final status with the JSON body, or the error text if not 200.
+    """
+    session = await get_session()
+    limiter = get_limiter()
+
+    for attempt in range(MAX_RETRIES + 1):
+        async with limiter:
+            async with session.post(API_ENDPOINT, json=payload) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    if response.status == 429:
+                        limiter.drain()
+                    delay = _retry_delay(response, attempt)
+                    await response.release()
+                else:
+                    if response.headers.get("X-RateLimit-Remaining") == "0":
+                        limiter.drain()
+
+                    if response.status != 200:
+                        return response.status, await response.text()
+                    return response.status, await response.json()
+
+        await asyncio.sleep(delay)
 
 
 async def list_transcripts(
@@ -152,23 +408,213 @@ async def list_transcripts(
     return data.get("transcripts", [])
 
 
-async def get_transcript(transcript_id: str) -> dict:
-    """Fetch a single transcript by ID."""
-    variables = {"transcriptId": transcript_id}
-    data = await graphql_request(GET_TRANSCRIPT_QUERY, variables)
-    return data.get("transcript", {})
+def _cache_path(transcript_id: str, fields: str) -> Path:
+    # Hash the ID too, so it can never escape the cache directory. The
+    # field selection is part of the key, so each field set (and any
+    # change to one) gets its own entry.
+    key = hashlib.sha256(transcript_id.encode()).hexdigest()[:24]
+    fields_hash = hashlib.sha256(fields.encode()).hexdigest()[:12]
+    return CACHE_DIR / f"{key}-{fields_hash}.json"
+
+
+def cache_get(transcript_id: str, fields: str = TRANSCRIPT_FIELDS) -> dict | None:
+    """Return the cached transcript, or None if missing, stale or unreadable."""
+    path = _cache_path(transcript_id, fields)
+    try:
+        if time.time() - path.stat().st_mtime >= CACHE_TTL:
+            return None
+        return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(transcript_id: str, transcript: dict, fields: str = TRANSCRIPT_FIELDS) -> None:
+    """Write a transcript to the cache atomically (temp file + rename)."""
+    path = _cache_path(transcript_id, fields)
+    tmp = path.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(orjson.dumps(transcript) if orjson is not None else json.dumps(transcript).encode())
+        tmp.replace(path)
+    except OSError:
+        pass  # caching is best effort
+
+
+async def get_transcript(
+    transcript_id: str,
+    use_cache: bool = True,
+    refresh: bool = False,
+    *,
+    sentences: bool = True,
+    summary: bool = True
+) -> dict:
+    """
+    Fetch a single transcript by ID.
+
+    sentences/summary choose whether those (large) fields are requested.
+    Served from the disk cache when use_cache is set and a fresh copy
+    exists; refresh skips the lookup but still stores the new copy.
+    """
+    fields = transcript_fields(sentences, summary)
+    key = (transcript_id, fields)
+
+    # Concurrent callers for the same transcript wait for one fetch
+    async with _memo_guard(key):
+        if use_cache and not refresh:
+            cached = _cached(transcript_id, fields)
+            if cached is not None:
+                return cached
+
+        variables = {"transcriptId": transcript_id}
+        data = await graphql_request(build_get_query(sentences, summary), variables)
+        transcript = data.get("transcript") or {}
+
+        if transcript:
+            _memo_put(key, transcript)
+            if use_cache:
+                cache_put(transcript_id, transcript, fields)
+        return transcript
+
+
+@contextlib.asynccontextmanager
+async def _memo_guard(key: tuple[str, str]):
+    """
+    Hold the lock for one (ID, field selection) key. The lock is dropped
+    once no task holds or waits on it, so _memo_locks stays bounded.
+    """
+    entry = _memo_locks.get(key)
+    if entry is None:
+        entry = _memo_locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _memo_locks[key]
+
+
+def _memo_put(key: tuple[str, str], transcript: dict) -> None:
+    _memo.pop(key, None)
+    _memo[key] = transcript
+    if len(_memo) > MEMO_SIZE:
+        del _memo[next(iter(_memo))]  # evict the oldest
+
+
+def _cached(transcript_id: str, fields: str) -> dict | None:
+    """Look a transcript up in the process memo, then the disk cache."""
+    key = (transcript_id, fields)
+    transcript = _memo.get(key)
+    if transcript is None:
+        transcript = cache_get(transcript_id, fields)
+        if transcript is not None:
+            _memo_put(key, transcript)
+    return transcript
+
+
+async def get_transcripts_batch(transcript_ids: list[str], fields: str = TRANSCRIPT_FIELDS) -> list[dict]:
+    """
+    Fetch several transcripts in a single GraphQL request, in the order given.
+
+    An ID the API can't resolve comes back as {} without failing the others.
+    """
+    if not transcript_ids:
+        return []
+    variables = {f"id{i}": tid for i, tid in enumerate(transcript_ids)}
+    data = await graphql_request(build_batch_query(len(transcript_ids), fields), variables, partial=True)
+    return [data.get(f"t{i}") or {} for i in range(len(transcript_ids))]
+
+
+async def get_transcripts_concurrent(
+    transcript_ids: list[str],
+    max_concurrency: int = MAX_CONCURRENCY,
+    batch_size: int = TRANSCRIPT_BATCH_SIZE,
+    use_cache: bool = True,
+    refresh: bool = False,
+    *,
+    sentences: bool = True,
+    summary: bool = True
+) -> list[dict | None]:
+    """
+    Fetch many transcripts, in the order given.
+
+    Fresh cached copies are used as in get_transcript. The rest are split
+    into batch queries of batch_size (keeping each response a manageable
+    size), and up to max_concurrency batches run at once over the shared
+    session. Each batch holds the same per-ID locks as get_transcript, so
+    overlapping calls fetch an ID only once.
+
+    Unknown IDs come back as {}. A batch that fails is reported on stderr
+    and its IDs come back as None, while the other batches are still
+    cached and returned; only when nothing could be fetched is the error
+    raised.
+    """
+    fields = transcript_fields(sentences, summary)
+    unique = list(dict.fromkeys(transcript_ids))
+    found = {}
+    if use_cache and not refresh:
+        for tid in unique:
+            cached = _cached(tid, fields)
+            if cached is not None:
+                found[tid] = cached
+    missing = [tid for tid in unique if tid not in found]
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(batch: list[str]) -> None:
+        async with contextlib.AsyncExitStack() as stack:
+            # Sorted, so overlapping calls take the locks in the same order
+            for tid in sorted(batch):
+                await stack.enter_async_context(_memo_guard((tid, fields)))
+            if use_cache and not refresh:
+                # Another caller may have fetched some of these meanwhile
+                for tid in batch:
+                    cached = _memo.get((tid, fields))
+                    if cached is not None:
+                        found[tid] = cached
+                batch = [tid for tid in batch if tid not in found]
+                if not batch:
+                    return
+            async with sem:
+                transcripts = await get_transcripts_batch(batch, fields)
+            for tid, transcript in zip(batch, transcripts):
+                found[tid] = transcript
+                if transcript:
+                    _memo_put((tid, fields), transcript)
+                    if use_cache:
+                        cache_put(tid, transcript, fields)
+
+    batches = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+    results = await asyncio.gather(*(_one(batch) for batch in batches), return_exceptions=True)
+
+    failures = [(batch, error) for batch, error in zip(batches, results) if isinstance(error, BaseException)]
+    if failures and not found:
+        raise failures[0][1]
+    for batch, error in failures:
+        print(f"Failed to fetch {', '.join(batch)}: {error}", file=sys.stderr)
+    return [found.get(tid) for tid in transcript_ids]
+
+
+def _duration_label(minutes: int) -> str:
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, remaining_mins = divmod(minutes, 60)
+    return f"{hours}h {remaining_mins}m"
+
+
+# Labels for the first two hours, which covers nearly every meeting
+_DURATION_LABELS = tuple(_duration_label(m) for m in range(121))
 
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human readable string."""
     if not seconds:
         return "Unknown"
-    minutes = int(seconds / 60)
-    if minutes < 60:
-        return f"{minutes}m"
-    hours = minutes // 60
-    remaining_mins = minutes % 60
-    return f"{hours}h {remaining_mins}m"
+    minutes = int(seconds) // 60
+    if 0 <= minutes <= 120:
+        return _DURATION_LABELS[minutes]
+    return _duration_label(minutes)
 
 
 def format_transcript_list(transcripts: list[dict]) -> str:
@@ -176,85 +622,98 @@ def format_transcript_list(transcripts: list[dict]) -> str:
     if not transcripts:
         return "No transcripts found."
 
-    lines = ["| # | Title | Date | Duration | Participants |"]
-    lines.append("|---|-------|------|----------|--------------|")
-
-    for i, t in enumerate(transcripts, 1):
-        title = t.get("title", "Untitled")[:40]
-        date = t.get("dateString", "Unknown")[:10]
-        duration = format_duration(t.get("duration"))
-        participants = ", ".join(t.get("participants", [])[:3])
-        if len(t.get("participants", [])) > 3:
-            participants += "..."
-        lines.append(f"| {i} | {title} | {date} | {duration} | {participants} |")
+    header = (
+        "| # | Title | Date | Duration | Participants |\n"
+        "|---|-------|------|----------|--------------|\n"
+    )
+    rows = [
+        f"| {i} | {t.get('title', 'Untitled')[:40]} | {t.get('dateString', 'Unknown')[:10]} "
+        f"| {format_duration(t.get('duration'))} | {_participants_cell(t.get('participants') or [])} |"
+        for i, t in enumerate(transcripts, 1)
+    ]
+    return header + "\n".join(rows)
 
-    return "\n".join(lines)
 
+def _participants_cell(participants: list) -> str:
+    """First three participants, with an ellipsis when there are more."""
+    cell = ", ".join(participants[:3])
+    return cell + "..." if len(participants) > 3 else cell
 
-def format_transcript_text(transcript: dict) -> str:
-    """Format transcript data as readable text."""
-    lines = []
 
+def iter_transcript_lines(transcript: dict) -> Iterator[str]:
+    """Yield the readable text of a transcript one line at a time."""
     # Header
-    lines.append(f"# {transcript.get('title', 'Untitled')}")
-    lines.append("")
-    lines.append(f"**Date:** {transcript.get('dateString', 'Unknown')}")
-    lines.append(f"**Duration:** {format_duration(transcript.get('duration'))}")
-    lines.append(f"**Participants:** {', '.join(transcript.get('participants', []))}")
+    yield f"# {transcript.get('title', 'Untitled')}"
+    yield ""
+    yield f"**Date:** {transcript.get('dateString', 'Unknown')}"
+    yield f"**Duration:** {format_duration(transcript.get('duration'))}"
+    yield f"**Participants:** {', '.join(transcript.get('participants', []))}"
     if transcript.get("transcript_url"):
-        lines.append(f"**Fireflies URL:** {transcript.get('transcript_url')}")
-    lines.append("")
+        yield f"**Fireflies URL:** {transcript.get('transcript_url')}"
+    yield ""
 
     # Summary (if available)
     summary = transcript.get("summary", {})
     if summary.get("overview"):
-        lines.append("---")
-        lines.append("")
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(summary["overview"])
-        lines.append("")
+        yield "---"
+        yield ""
+        yield "## Summary"
+        yield ""
+        yield summary["overview"]
+        yield ""
 
     if summary.get("action_items"):
-        lines.append("## Action Items")
-        lines.append("")
+        yield "## Action Items"
+        yield ""
         for item in summary["action_items"]:
-            lines.append(f"- {item}")
-        lines.append("")
+            yield f"- {item}"
+        yield ""
 
     # Full transcript
     sentences = transcript.get("sentences", [])
     if sentences:
-        lines.append("---")
-        lines.append("")
-        lines.append("## Full Transcript")
-        lines.append("")
+        yield "---"
+        yield ""
+        yield "## Full Transcript"
+        yield ""
 
+        # Buffer each speaker's sentences and join once, rather than
+        # growing the last line with repeated string concatenation
         current_speaker = None
+        current_parts: list[str] = []
         for sentence in sentences:
             speaker = sentence.get("speaker_name", "Unknown")
             text = sentence.get("text", "")
 
             if speaker != current_speaker:
-                if current_speaker is not None:
-                    lines.append("")
-                lines.append(f"**{speaker}:** {text}")
+                if current_parts:
+                    yield f"**{current_speaker}:** " + " ".join(current_parts)
+                    yield ""
                 current_speaker = speaker
+                current_parts = [text]
             else:
-                lines[-1] += f" {text}"
+                current_parts.append(text)
 
-    return "\n".join(lines)
+        if current_parts:
+            yield f"**{current_speaker}:** " + " ".join(current_parts)
 
 
-def save_transcript(transcript: dict, output_path: str) -> None:
-    """Save transcript to markdown file."""
-    content = format_transcript_text(transcript)
+def format_transcript_text(transcript: dict) -> str:
+    """Format transcript data as readable text."""
+    return "\n".join(iter_transcript_lines(transcript))
 
+
+def save_transcript(transcript: dict, output_path: str) -> None:
+    """Save transcript to markdown file, streaming it line by line."""
     # Ensure directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Never holds the whole document in memory
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        for i, line in enumerate(iter_transcript_lines(transcript)):
+            if i:
+                f.write("\n")
+            f.write(line)
 
     print(f"Saved to: {output_path}")
 
@@ -270,7 +729,7 @@ async def cmd_list(args):
     )
 
     if args.json:
-        print(json.dumps(transcripts, indent=2))
+        print(dump_json(transcripts))
     else:
         print(format_transcript_list(transcripts))
         print(f"\nTotal: {len(transcripts)} transcript(s)")
@@ -284,20 +743,81 @@ async def cmd_list(args):
 
 async def cmd_get(args):
     """Handle get command."""
-    transcript = await get_transcript(args.transcript_id)
+    if args.ids:
+        args.transcript_ids += [tid.strip() for tid in args.ids.split(",") if tid.strip()]
+    if not args.transcript_ids:
+        print("Error: provide at least one transcript ID")
+        sys.exit(1)
+
+    if len(args.transcript_ids) > 1:
+        await cmd_get_many(args)
+        return
+
+    transcript_id = args.transcript_ids[0]
+    transcript = await get_transcript(
+        transcript_id, use_cache=not args.no_cache, refresh=args.refresh, sentences=not args.summary_only
+    )
 
     if not transcript:
-        print(f"Transcript not found: {args.transcript_id}")
+        print(f"Transcript not found: {transcript_id}")
         return
 
     if args.json:
-        print(json.dumps(transcript, indent=2))
+        print(dump_json(transcript))
     elif args.output:
         save_transcript(transcript, args.output)
     else:
         print(format_transcript_text(transcript))
 
 
+async def cmd_get_many(args):
+    """Handle get with several IDs: batched concurrent requests, then save or print each."""
+    transcripts = await get_transcripts_concurrent(
+        args.transcript_ids, use_cache=not args.no_cache, refresh=args.refresh, sentences=not args.summary_only
+    )
+
+    found = []
+    for transcript_id, transcript in zip(args.transcript_ids, transcripts):
+        if transcript:
+            found.append(transcript)
+        elif transcript is not None:  # None: its batch failed, already reported
+            # stderr, so --json output stays parseable
+            print(f"Transcript not found: {transcript_id}", file=sys.stderr)
+
+    if args.json:
+        print(dump_json(found))
+    elif args.output:
+        # --output is a directory here; one file per transcript
+        await asyncio.gather(*(
+            asyncio.to_thread(save_transcript, t, str(Path(args.output) / f"{t['id']}.md"))
+            for t in found
+        ))
+    else:
+        print("\n\n".join(format_transcript_text(t) for t in found))
+
+
+COMMANDS = {"list": cmd_list, "get": cmd_get}
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """
+    Run one parsed command.
+
+    The shared session is left open, so a caller importing this module can
+    run several commands in one event loop over the same connections, then
+    call close_session() once at the end.
+    """
+    await COMMANDS[args.command](args)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run a single command, then close the shared session."""
+    try:
+        await _async_main(args)
+    finally:
+        await close_session()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fireflies.ai Transcript Tool")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -312,17 +832,20 @@ def main():
     list_parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
 
     # Get command
-    get_parser = subparsers.add_parser("get", help="Get a specific transcript")
-    get_parser.add_argument("transcript_id", help="Transcript ID")
-    get_parser.add_argument("--output", "-o", help="Save to file path")
+    get_parser = subparsers.add_parser("get", help="Get one or more transcripts")
+    get_parser.add_argument("transcript_ids", nargs="*", metavar="transcript_id", help="Transcript ID(s)")
+    get_parser.add_argument("--ids", help="Comma-separated transcript IDs (alternative to positional IDs)")
+    get_parser.add_argument("--output", "-o", help="Save to file path (a directory when several IDs are given)")
     get_parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    get_parser.add_argument("--summary-only", action="store_true", help="Skip the full transcript sentences (much smaller response)")
+    get_parser.add_argument("--no-cache", action="store_true", help="Don't read or write the transcript cache")
+    get_parser.add_argument("--refresh", action="store_true", help="Re-fetch even if cached (updates the cache)")
 
     args = parser.parse_args()
 
-    if args.command == "list":
-        asyncio.run(cmd_list(args))
-    elif args.command == "get":
-        asyncio.run(cmd_get(args))
+    # uvloop speeds up the aiohttp-bound event loop where it is installed
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(_run(args))
 
 
 if __name__ == "__main__":
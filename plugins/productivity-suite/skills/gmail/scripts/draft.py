@@ -5,6 +5,7 @@
 #     "google-api-python-client>=2.100.0",
 #     "google-auth-oauthlib>=1.1.0",
 #     "markdown>=3.5.0",
+#     "pybase64>=1.3",  # optional: falls back to base64
 # ]
 # ///
 """
@@ -17,14 +18,157 @@ Usage:
     python draft.py reply --thread-id <id> --body reply.txt
     python draft.py list
     python draft.py delete <draft_id>
+    python draft.py batch < ops.jsonl
 """
 
 import argparse
+import json
+import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 from gmail_client import GmailClient
 
+# Address inside "Name <email>", and an existing reply prefix on a subject
+_ADDR_RE = re.compile(r'<([^>]+)>')
+_RE_PREFIX_RE = re.compile(r're:', re.IGNORECASE)
+
+
+def load_attachments(paths: list[str] | None, uses: Counter, shared: dict) -> list | None:
+    """
+    Attachments for one draft of a batch, as create_draft takes them.
+
+    A file attached to several drafts (counted in uses) is read once into
+    shared and passed as (filename, bytes), then dropped after its last use.
+    Other files are passed as paths, so create_draft streams them from disk.
+    Unreadable shared files are skipped with a warning.
+    """
+    if not paths:
+        return None
+    attachments = []
+    for path in paths:
+        if uses[path] < 2 and path not in shared:
+            attachments.append(path)
+            continue
+        if path not in shared:
+            try:
+                shared[path] = (Path(path).name, Path(path).read_bytes())
+            except OSError:
+                print(f"Warning: Attachment not found: {path}", file=sys.stderr)
+                shared[path] = None
+        if shared[path] is not None:
+            attachments.append(shared[path])
+        uses[path] -= 1
+        if not uses[path]:
+            del shared[path]
+    return attachments
+
+
+def reply_headers(thread: dict) -> tuple[str, str]:
+    """Recipient address and subject for a reply to the thread's last message."""
+    last_msg = thread['messages'][-1]
+    subject = last_msg['subject']
+    if not _RE_PREFIX_RE.match(subject):
+        subject = f"Re: {subject}"
+
+    # If last message was sent BY me (has SENT label), reply to the 'to' field
+    # Otherwise, reply to the sender
+    if 'SENT' in last_msg.get('labels', []):
+        to = last_msg['to']
+    else:
+        to = last_msg['from']
+
+    # Extract email from "Name <email>" format
+    match = _ADDR_RE.search(to)
+    if match:
+        to = match.group(1)
+
+    return to, subject
+
+
+def run_batch(client: GmailClient, lines) -> bool:
+    """
+    Run newline-delimited JSON draft operations with one client.
+
+    Each line is one of:
+        {"op": "create", "to": ..., "subject": ..., "body": ..., "cc": ..., "bcc": ..., "attach": [...], "thread_id": ...}
+        {"op": "reply", "thread_id": ..., "body": ..., "attach": [...]}
+        {"op": "delete", "draft_id": ...}
+
+    Bodies are inline text. Returns True if every operation succeeded.
+    """
+    ops = []
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            ops.append((n, json.loads(line)))
+        except ValueError as e:
+            ops.append((n, e))
+
+    # Fetch every thread being replied to up front, in batch requests
+    reply_ids = [
+        op['thread_id'] for _, op in ops
+        if isinstance(op, dict) and op.get('op') == 'reply' and isinstance(op.get('thread_id'), str)
+    ]
+    threads = client.get_threads(reply_ids) if reply_ids else {}
+
+    # Files attached to several drafts are read once; see load_attachments
+    uses = Counter(
+        path for _, op in ops
+        if isinstance(op, dict) and isinstance(op.get('attach'), list)
+        for path in op['attach'] if isinstance(path, str)
+    )
+    shared = {}
+
+    ok = True
+    for n, op in ops:
+        try:
+            if isinstance(op, Exception):
+                raise op
+            kind = op['op']
+            if kind == 'create':
+                draft = client.create_draft(
+                    to=op['to'],
+                    subject=op['subject'],
+                    body=op['body'],
+                    cc=op.get('cc'),
+                    bcc=op.get('bcc'),
+                    attachments=load_attachments(op.get('attach'), uses, shared),
+                    thread_id=op.get('thread_id')
+                )
+                result = f"Draft ID: {draft['id']}" if draft else None
+            elif kind == 'reply':
+                thread = threads.get(op['thread_id'])
+                if not thread:
+                    raise ValueError(f"Thread not found: {op['thread_id']}")
+                to, subject = reply_headers(thread)
+                draft = client.create_draft(
+                    to=to,
+                    subject=subject,
+                    body=op['body'],
+                    thread_id=op['thread_id'],
+                    attachments=load_attachments(op.get('attach'), uses, shared)
+                )
+                result = f"Draft ID: {draft['id']} (to {to})" if draft else None
+            elif kind == 'delete':
+                result = "deleted" if client.delete_draft(op['draft_id']) else None
+            else:
+                raise ValueError(f"Unknown op: {kind}")
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"  [{n}] Error: {e}", file=sys.stderr)
+            ok = False
+            continue
+
+        if result:
+            print(f"  [{n}] {kind}: {result}")
+        else:
+            print(f"  [{n}] {kind}: failed", file=sys.stderr)
+            ok = False
+    return ok
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -50,6 +194,9 @@ Examples:
   # List drafts
   python draft.py list
 
+  # Several drafts with one client (JSON ops on stdin, see run_batch)
+  python draft.py batch < ops.jsonl
+
 IMPORTANT: This creates DRAFTS only. To send, open Gmail and send manually.
 """
     )
@@ -80,6 +227,9 @@ IMPORTANT: This creates DRAFTS only. To send, open Gmail and send manually.
     delete_parser = subparsers.add_parser('delete', help='Delete a draft')
     delete_parser.add_argument('draft_id', help='Draft ID to delete')
 
+    # Batch command
+    subparsers.add_parser('batch', help='Run newline-delimited JSON operations from stdin')
+
     args = parser.parse_args()
 
     client = GmailClient()
@@ -134,31 +284,8 @@ IMPORTANT: This creates DRAFTS only. To send, open Gmail and send manually.
             print(f"Thread not found: {args.thread_id}", file=sys.stderr)
             sys.exit(1)
 
-        # Get last message to determine reply subject and recipient
-        last_msg = thread['messages'][-1]
-        subject = last_msg['subject']
-        if not subject.lower().startswith('re:'):
-            subject = f"Re: {subject}"
-
-        # Determine recipient
-        # If last message was sent BY me (has SENT label), reply to the 'to' field
-        # Otherwise, reply to the sender
-        import re
-
-        is_sent_by_me = 'SENT' in last_msg.get('labels', [])
-
-        if is_sent_by_me:
-            # I sent the last message, so reply to the original recipient
-            to = last_msg['to']
-        else:
-            # Someone else sent the last message, reply to them
-            to = last_msg['from']
-
-        # Extract email from "Name <email>" format
-        if '<' in to:
-            match = re.search(r'<([^>]+)>', to)
-            if match:
-                to = match.group(1)
+        # Last message determines reply subject and recipient
+        to, subject = reply_headers(thread)
 
         # Read body
         if args.body == '-':
@@ -221,6 +348,12 @@ IMPORTANT: This creates DRAFTS only. To send, open Gmail and send manually.
             print("Failed to delete draft.", file=sys.stderr)
             sys.exit(1)
 
+    elif args.command == 'batch':
+        # One client, so credentials and the API service are set up once
+        print("Running batch operations...")
+        if not run_batch(client, sys.stdin):
+            sys.exit(1)
+
 
 if __name__ == '__main__':
     main()
@@ -14,35 +14,126 @@ Usage:
 """
 
 import base64
-import mimetypes
+import functools
+import json
 import os
 import sys
+from collections import deque
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
+    import httplib2
+    from google.auth.transport.requests import AuthorizedSession
     from googleapiclient.discovery import build
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Missing dependencies. Install with:")
     print("  pip install google-api-python-client")
     sys.exit(1)
 
+# SIMD base64 codec when installed; same API as the stdlib functions
 try:
-    import markdown
+    import pybase64
+    _b64decode = pybase64.urlsafe_b64decode
+    _b64encode = pybase64.urlsafe_b64encode
+    _encodebytes = pybase64.encodebytes
 except ImportError:
-    print("Missing markdown library. Install with:")
-    print("  pip install markdown")
-    sys.exit(1)
-
+    _b64decode = base64.urlsafe_b64decode
+    _b64encode = base64.urlsafe_b64encode
+    _encodebytes = base64.encodebytes
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Attachment bytes encoded per step: a whole number of 57-byte input
+# lines, so every chunk encodes to complete 76-character base64 lines
+_ENCODE_CHUNK = 57 * 4096
+
+
+# Headers kept by _parse_message
+_WANTED_HEADERS = frozenset(('from', 'to', 'subject', 'date', 'cc', 'bcc'))
+
+
+def dump_json(data) -> bytes:
+    """Serialize output as indented UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def write_json(data, path: Path, compress: bool = False) -> None:
+    """
+    Write data to path as dump_json does, gzip-compressed if compress is set.
+
+    orjson renders straight to bytes; without it, the stdlib encoder streams
+    into a large write buffer, so the full document never exists as a str.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress:
+        import gzip
+        opener = functools.partial(gzip.open, compresslevel=3)
+    else:
+        opener = functools.partial(open, buffering=1 << 20)
+
+    if orjson is not None:
+        with opener(path, 'wb') as f:
+            f.write(dump_json(data))
+    else:
+        with opener(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _base64_payload(chunks) -> str:
+    """
+    MIME base64 for a stream of byte chunks, as encoders.encode_base64 writes it.
+
+    Each chunk must be a multiple of 57 bytes except the last. Only the
+    encoded output is accumulated, never a second copy of the raw data.
+    """
+    encoded = bytearray()
+    for chunk in chunks:
+        encoded += _encodebytes(chunk)
+    return encoded.decode('ascii')
+
+
+def _iter_chunks(data: bytes):
+    view = memoryview(data)
+    for start in range(0, len(view), _ENCODE_CHUNK):
+        yield view[start:start + _ENCODE_CHUNK]
+
+
+def _iter_file_chunks(path: Path):
+    with open(path, 'rb') as f:
+        while chunk := f.read(_ENCODE_CHUNK):
+            yield chunk
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_converter():
+    """
+    One converter, reset between documents, instead of rebuilding the
+    parser and its extensions for every draft. Built on first use, so the
+    read-only CLIs never import markdown.
+    """
+    try:
+        import markdown
+    except ImportError:
+        print("Missing markdown library. Install with:")
+        print("  pip install markdown")
+        sys.exit(1)
+    return markdown.Markdown(extensions=['tables', 'nl2br'])
+
+
+# A batch often sends one body to many recipients; 128 bodies of a few KB
+# each covers a batch's distinct bodies in well under a megabyte
+@functools.lru_cache(maxsize=128)
 def _markdown_to_html(text: str) -> str:
     """Convert markdown to HTML with tables and line break support."""
-    return markdown.markdown(text, extensions=['tables', 'nl2br'])
+    return _markdown_converter().reset().convert(text)
 
 # Add integrations to path for shared auth
 SKILL_DIR = Path(__file__).parent.parent
@@ -52,9 +143,47 @@ sys.path.insert(0, str(INTEGRATIONS_DIR))
 from google_auth import get_gmail_credentials
 
 
+class _SessionHttp:
+    """
+    httplib2-style transport for googleapiclient over a pooled requests session.
+
+    The AuthorizedSession adds the OAuth header and refreshes expired tokens;
+    its urllib3 pool keeps connections alive across every call and batch.
+    """
+
+    def __init__(self, session: AuthorizedSession, timeout: float = 60):
+        self.session = session
+        self.timeout = timeout
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=5, connection_type=None):
+        response = self.session.request(method, uri, data=body, headers=headers, timeout=self.timeout)
+        info = {name.lower(): value for name, value in response.headers.items()}
+        info['status'] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+
 class GmailClient:
     """Gmail API client wrapper."""
 
+    # Sub-requests per batch HTTP request. The API allows 100, but Gmail
+    # rate-limits batches larger than 50.
+    BATCH_SIZE = 50
+
+    # Most message IDs messages.list returns per page
+    MAX_PAGE_SIZE = 500
+
+    # Partial-response masks: only the fields _parse_message reads
+    MESSAGE_FIELDS = {
+        'metadata': 'id,threadId,labelIds,snippet,internalDate,payload/headers',
+        'full': 'id,threadId,labelIds,snippet,internalDate,payload',
+    }
+    THREAD_FIELDS = 'id,messages(id,threadId,labelIds,snippet,internalDate,payload)'
+
+    # The only headers returned for format='metadata'
+    METADATA_HEADERS = ['From', 'To', 'Cc', 'Subject', 'Date']
+
     def __init__(self, include_send_scope: bool = False):
         """
         Initialize Gmail client.
@@ -63,8 +192,14 @@ class GmailClient:
             include_send_scope: If True, request gmail.send scope
         """
         credentials = get_gmail_credentials(send=include_send_scope)
-        self.service = build('gmail', 'v1', credentials=credentials)
+        # One service over one pooled session per client; reuse the client
+        # for batches. Discovery docs ship with the library, so skip the cache.
+        session = AuthorizedSession(credentials)
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+        self.service = build('gmail', 'v1', http=_SessionHttp(session), cache_discovery=False)
         self.user_id = 'me'
+        # Case-folded label name -> ID, loaded on first label lookup
+        self._label_cache: Optional[dict[str, str]] = None
 
     # =========================================================================
     # Search & List
@@ -87,32 +222,113 @@ class GmailClient:
         Returns:
             List of message dicts with id, threadId, snippet, etc.
         """
-        params = {
-            'userId': self.user_id,
-            'maxResults': max_results,
-        }
+        return list(self.iter_search(
+            query,
+            label_ids=label_ids,
+            page_size=min(max_results, self.MAX_PAGE_SIZE),
+            max_results=max_results
+        ))
+
+    def iter_search(
+        self,
+        query: str = '',
+        label_ids: list[str] = None,
+        page_size: int = 100,
+        max_results: Optional[int] = None
+    ) -> Iterator[dict]:
+        """
+        Search for messages, yielding them a page at a time.
+
+        Follows nextPageToken until max_results (or every match, if None)
+        have been listed, so memory is bounded by one page. Stopping
+        early skips the remaining pages.
+
+        Args:
+            query: Gmail search query (e.g., "from:x is:unread")
+            label_ids: Filter by labels (e.g., ['INBOX', 'UNREAD'])
+            page_size: Message IDs to list per request (up to 500)
+            max_results: Maximum messages to return
+
+        Yields:
+            Message dicts as from search()
+        """
+        params = {'userId': self.user_id}
         if query:
             params['q'] = query
         if label_ids:
             params['labelIds'] = label_ids
 
-        results = self.service.users().messages().list(**params).execute()
-        messages = results.get('messages', [])
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            params['maxResults'] = page_size if remaining is None else min(page_size, remaining)
+            results = self.service.users().messages().list(**params).execute()
+            messages = results.get('messages', [])
+
+            # Fetch details in batch requests rather than one round-trip each
+            responses = self._execute_batch(
+                [self._message_request(msg['id'], 'metadata') for msg in messages],
+                [f"message {msg['id']}" for msg in messages]
+            )
+            for msg in responses:
+                if msg:
+                    yield self._parse_message(msg)
+
+            if remaining is not None:
+                remaining -= len(messages)
+            params['pageToken'] = results.get('nextPageToken')
+            if not params['pageToken'] or not messages:
+                break
+
+    def _execute_batch(self, requests: list, names: list[str]) -> list[Optional[dict]]:
+        """
+        Execute API requests in batch HTTP requests of BATCH_SIZE.
+
+        Args:
+            requests: Unexecuted API requests
+            names: What each request fetches, for error messages
+
+        Returns:
+            Responses in request order, None where a request failed
+        """
+        # Callbacks may arrive in any order, so slot results by index
+        responses = [None] * len(requests)
 
-        # Fetch details for each message
-        detailed = []
-        for msg in messages:
-            details = self.get_message(msg['id'], format='metadata')
-            if details:
-                detailed.append(details)
+        def collect(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                print(f"Error getting {names[index]}: {exception}", file=sys.stderr)
+            else:
+                responses[index] = response
 
-        return detailed
+        for start in range(0, len(requests), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=collect)
+            for index in range(start, min(start + self.BATCH_SIZE, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            batch.execute()
+
+        return responses
 
     def list_labels(self) -> list[dict]:
         """Get all labels in the mailbox."""
         results = self.service.users().labels().list(userId=self.user_id).execute()
         return results.get('labels', [])
 
+    def _labels_by_name(self, refresh: bool = False) -> dict[str, str]:
+        """Label IDs by case-folded name, fetched once and reused."""
+        if self._label_cache is None or refresh:
+            self._label_cache = {label['name'].casefold(): label['id'] for label in self.list_labels()}
+        return self._label_cache
+
+    def _find_label_id(self, name: str) -> Optional[str]:
+        """Look a label up in the cache, refreshing once on a miss."""
+        key = name.casefold()
+        loaded = self._label_cache is not None
+        label_id = self._labels_by_name().get(key)
+        if label_id is None and loaded:
+            # May have been created since the cache was loaded
+            label_id = self._labels_by_name(refresh=True).get(key)
+        return label_id
+
     # =========================================================================
     # Read Messages & Threads
     # =========================================================================
@@ -133,16 +349,21 @@ class GmailClient:
             Message dict with headers, body, etc.
         """
         try:
-            msg = self.service.users().messages().get(
-                userId=self.user_id,
-                id=message_id,
-                format=format
-            ).execute()
+            msg = self._message_request(message_id, format).execute()
             return self._parse_message(msg)
         except Exception as e:
             print(f"Error getting message {message_id}: {e}", file=sys.stderr)
             return None
 
+    def _message_request(self, message_id: str, format: str):
+        """Build a messages.get request that fetches only what is parsed."""
+        params = {'userId': self.user_id, 'id': message_id, 'format': format}
+        if format in self.MESSAGE_FIELDS:
+            params['fields'] = self.MESSAGE_FIELDS[format]
+        if format == 'metadata':
+            params['metadataHeaders'] = self.METADATA_HEADERS
+        return self.service.users().messages().get(**params)
+
     def get_thread(self, thread_id: str) -> Optional[dict]:
         """
         Get a full conversation thread.
@@ -157,32 +378,63 @@ class GmailClient:
             thread = self.service.users().threads().get(
                 userId=self.user_id,
                 id=thread_id,
-                format='full'
+                format='full',
+                fields=self.THREAD_FIELDS
             ).execute()
-
-            # Parse each message in thread
-            messages = []
-            for msg in thread.get('messages', []):
-                parsed = self._parse_message(msg)
-                if parsed:
-                    messages.append(parsed)
-
-            return {
-                'id': thread['id'],
-                'messages': messages,
-                'message_count': len(messages)
-            }
+            return self._parse_thread(thread)
         except Exception as e:
             print(f"Error getting thread {thread_id}: {e}", file=sys.stderr)
             return None
 
+    def get_threads(self, thread_ids: list[str]) -> dict[str, Optional[dict]]:
+        """
+        Get several threads at once, in batch requests.
+
+        Args:
+            thread_ids: Thread IDs
+
+        Returns:
+            Thread ID -> thread dict as from get_thread, or None if not found
+        """
+        thread_ids = list(dict.fromkeys(thread_ids))
+        responses = self._execute_batch(
+            [
+                self.service.users().threads().get(
+                    userId=self.user_id,
+                    id=thread_id,
+                    format='full',
+                    fields=self.THREAD_FIELDS
+                )
+                for thread_id in thread_ids
+            ],
+            [f"thread {thread_id}" for thread_id in thread_ids]
+        )
+        return {
+            thread_id: self._parse_thread(thread) if thread else None
+            for thread_id, thread in zip(thread_ids, responses)
+        }
+
+    def _parse_thread(self, thread: dict) -> dict:
+        """Parse raw thread and its messages into structured format."""
+        messages = []
+        for msg in thread.get('messages', []):
+            parsed = self._parse_message(msg)
+            if parsed:
+                messages.append(parsed)
+
+        return {
+            'id': thread['id'],
+            'messages': messages,
+            'message_count': len(messages)
+        }
+
     def _parse_message(self, msg: dict) -> dict:
         """Parse raw message into structured format."""
-        headers = {}
-        for header in msg.get('payload', {}).get('headers', []):
-            name = header['name'].lower()
-            if name in ['from', 'to', 'subject', 'date', 'cc', 'bcc']:
-                headers[name] = header['value']
+        headers = {
+            name: header['value']
+            for header in msg.get('payload', {}).get('headers', ())
+            if (name := header['name'].lower()) in _WANTED_HEADERS
+        }
 
         # Get body
         body = self._extract_body(msg.get('payload', {}))
@@ -209,32 +461,36 @@ class GmailClient:
         }
 
     def _extract_body(self, payload: dict) -> str:
-        """Extract body text from message payload."""
-        body = ''
+        """
+        Extract body text from message payload.
 
+        Walks the MIME tree breadth-first: the first text/plain part wins,
+        otherwise the first text/html part. Attachments are skipped.
+        """
         # Direct body
-        if 'body' in payload and payload['body'].get('data'):
-            body = base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8', errors='ignore')
+        if payload.get('body', {}).get('data'):
+            return _b64decode(payload['body']['data']).decode('utf-8', errors='ignore')
 
         # Multipart
-        elif 'parts' in payload:
-            for part in payload['parts']:
-                mime_type = part.get('mimeType', '')
-
-                if mime_type == 'text/plain' and part.get('body', {}).get('data'):
-                    body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8', errors='ignore')
-                    break
-                elif mime_type == 'text/html' and not body and part.get('body', {}).get('data'):
-                    # Fallback to HTML if no plain text
-                    body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8', errors='ignore')
-                elif 'parts' in part:
-                    # Nested multipart
-                    nested = self._extract_body(part)
-                    if nested:
-                        body = nested
-                        break
-
-        return body
+        html_data = None
+        queue = deque(payload.get('parts', ()))
+        while queue:
+            part = queue.popleft()
+            if part.get('filename'):
+                continue
+
+            data = part.get('body', {}).get('data')
+            mime_type = part.get('mimeType', '')
+            if data and mime_type == 'text/plain':
+                return _b64decode(data).decode('utf-8', errors='ignore')
+            if data and mime_type == 'text/html' and html_data is None:
+                # Fallback to HTML if no plain text; decoded only if needed
+                html_data = data
+            queue.extend(part.get('parts', ()))
+
+        if html_data:
+            return _b64decode(html_data).decode('utf-8', errors='ignore')
+        return ''
 
     # =========================================================================
     # Modify Messages (Archive, Snooze, Label)
@@ -336,13 +592,7 @@ class GmailClient:
 
     def remove_label(self, message_id: str, label_name: str) -> bool:
         """Remove a label from a message."""
-        labels = self.list_labels()
-        label_id = None
-        for label in labels:
-            if label['name'].lower() == label_name.lower():
-                label_id = label['id']
-                break
-
+        label_id = self._find_label_id(label_name)
         if not label_id:
             print(f"Label not found: {label_name}", file=sys.stderr)
             return False
@@ -360,11 +610,9 @@ class GmailClient:
 
     def _get_or_create_label(self, name: str) -> Optional[str]:
         """Get label ID, creating if necessary."""
-        labels = self.list_labels()
-
-        for label in labels:
-            if label['name'].lower() == name.lower():
-                return label['id']
+        label_id = self._find_label_id(name)
+        if label_id:
+            return label_id
 
         # Create new label
         try:
@@ -372,6 +620,7 @@ class GmailClient:
                 userId=self.user_id,
                 body={'name': name}
             ).execute()
+            self._labels_by_name()[name.casefold()] = result['id']
             return result['id']
         except Exception as e:
             print(f"Error creating label: {e}", file=sys.stderr)
@@ -401,11 +650,17 @@ class GmailClient:
             cc: CC recipients
             bcc: BCC recipients
             thread_id: Thread ID for replies
-            attachments: List of file paths to attach
+            attachments: Files to attach, as paths or (filename, bytes) tuples
 
         Returns:
             Draft dict with id
         """
+        # Only drafts build MIME messages; keep these off the read paths
+        import mimetypes
+        from email.mime.base import MIMEBase
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         html_body = _markdown_to_html(body)
 
         if attachments:
@@ -422,28 +677,33 @@ class GmailClient:
             message.attach(MIMEText(html_body, 'html'))
 
             # Attach files
-            for file_path in attachments:
-                file_path = Path(file_path)
-                if not file_path.exists():
-                    print(f"Warning: Attachment not found: {file_path}", file=sys.stderr)
-                    continue
+            for item in attachments:
+                if isinstance(item, tuple):
+                    # Already read by the caller
+                    filename, data = item
+                    chunks = _iter_chunks(data)
+                else:
+                    file_path = Path(item)
+                    if not file_path.exists():
+                        print(f"Warning: Attachment not found: {file_path}", file=sys.stderr)
+                        continue
+                    # Streamed: the file is never held in memory unencoded
+                    filename, chunks = file_path.name, _iter_file_chunks(file_path)
 
                 # Guess the content type
-                content_type, encoding = mimetypes.guess_type(str(file_path))
+                content_type, encoding = mimetypes.guess_type(filename)
                 if content_type is None:
                     content_type = 'application/octet-stream'
 
                 main_type, sub_type = content_type.split('/', 1)
 
-                with open(file_path, 'rb') as f:
-                    attachment = MIMEBase(main_type, sub_type)
-                    attachment.set_payload(f.read())
-
-                encoders.encode_base64(attachment)
+                attachment = MIMEBase(main_type, sub_type)
+                attachment.set_payload(_base64_payload(chunks))
+                attachment['Content-Transfer-Encoding'] = 'base64'
                 attachment.add_header(
                     'Content-Disposition',
                     'attachment',
-                    filename=file_path.name
+                    filename=filename
                 )
                 message.attach(attachment)
         else:
@@ -456,7 +716,7 @@ class GmailClient:
             if bcc:
                 message['bcc'] = bcc
 
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        raw = _b64encode(message.as_bytes()).decode()
 
         draft_body = {'message': {'raw': raw}}
         if thread_id:
@@ -5,6 +5,8 @@
 #     "google-api-python-client>=2.100.0",
 #     "google-auth-oauthlib>=1.1.0",
 #     "markdown>=3.5.0",
+#     "pybase64>=1.3",  # optional: falls back to base64
+#     "orjson>=3.9",  # optional: falls back to json
 # ]
 # ///
 """
@@ -16,15 +18,15 @@ Usage:
     python read.py --message-id <id>        # Read single message
     python read.py --thread-id <id>         # Read full conversation
     python read.py --thread-id <id> --output thread.json
+    python read.py --thread-id <id> --output thread.json.gz --gzip
 """
 
 import argparse
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
-from gmail_client import GmailClient
+from gmail_client import GmailClient, dump_json, write_json
 
 
 def format_message(msg: dict, include_body: bool = True) -> str:
@@ -91,9 +93,17 @@ Examples:
         action='store_true',
         help='Omit message bodies (show snippets only)'
     )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Gzip-compress the --output file'
+    )
 
     args = parser.parse_args()
 
+    if args.gzip and not args.output:
+        parser.error("--gzip requires --output")
+
     client = GmailClient()
 
     # Read message or thread
@@ -112,14 +122,11 @@ Examples:
         }
 
         if args.json or args.output:
-            output = json.dumps(data, indent=2)
             if args.output:
-                Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-                with open(args.output, 'w') as f:
-                    f.write(output)
+                write_json(data, Path(args.output), compress=args.gzip)
                 print(f"Saved to {args.output}", file=sys.stderr)
             else:
-                print(output)
+                sys.stdout.buffer.write(dump_json(data) + b'\n')
         else:
             print(format_message(msg, include_body=not args.no_body))
 
@@ -140,14 +147,11 @@ Examples:
         }
 
         if args.json or args.output:
-            output = json.dumps(data, indent=2)
             if args.output:
-                Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-                with open(args.output, 'w') as f:
-                    f.write(output)
+                write_json(data, Path(args.output), compress=args.gzip)
                 print(f"Saved to {args.output}", file=sys.stderr)
             else:
-                print(output)
+                sys.stdout.buffer.write(dump_json(data) + b'\n')
         else:
             print(f"\nConversation ({thread['message_count']} messages)")
             print()
@@ -5,6 +5,8 @@
 #     "google-api-python-client>=2.100.0",
 #     "google-auth-oauthlib>=1.1.0",
 #     "markdown>=3.5.0",
+#     "pybase64>=1.3",  # optional: falls back to base64
+#     "orjson>=3.9",  # optional: falls back to json
 # ]
 # ///
 """
@@ -18,23 +20,29 @@ Usage:
     python search.py --unread               # Show only unread
     python search.py --limit 50             # Get more results
     python search.py --output results.json  # Save to file
+    python search.py --output results.json.gz --gzip
 """
 
 import argparse
-import json
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
-from gmail_client import GmailClient
+from gmail_client import GmailClient, dump_json, write_json
+
+
+# Display name before "<address>", without surrounding whitespace and quotes
+_SENDER_NAME_RE = re.compile(r'\s*"*([^<]*?)"*\s*<')
 
 
 def format_message_row(msg: dict, width: int = 80) -> str:
     """Format a message for display."""
     # Extract sender name/email
     sender = msg['from']
-    if '<' in sender:
-        sender = sender.split('<')[0].strip().strip('"')
+    match = _SENDER_NAME_RE.match(sender)
+    if match:
+        sender = match.group(1)
     sender = sender[:25].ljust(25)
 
     # Subject
@@ -98,9 +106,17 @@ Examples:
         action='store_true',
         help='Output as JSON to stdout'
     )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Gzip-compress the --output file'
+    )
 
     args = parser.parse_args()
 
+    if args.gzip and not args.output:
+        parser.error("--gzip requires --output")
+
     # Build query
     query = args.query
     if args.unread and 'is:unread' not in query:
@@ -108,18 +124,19 @@ Examples:
 
     print(f"Searching: {query}", file=sys.stderr)
 
-    # Search
     client = GmailClient()
-    messages = client.search(query=query, max_results=args.limit)
-
-    if not messages:
-        print("No messages found.", file=sys.stderr)
-        sys.exit(0)
-
-    print(f"Found {len(messages)} messages", file=sys.stderr)
 
     # Output
     if args.json or args.output:
+        # The JSON document leads with the count, so collect everything first
+        messages = client.search(query=query, max_results=args.limit)
+
+        if not messages:
+            print("No messages found.", file=sys.stderr)
+            sys.exit(0)
+
+        print(f"Found {len(messages)} messages", file=sys.stderr)
+
         output_data = {
             'query': query,
             'searched_at': datetime.now().isoformat(),
@@ -129,22 +146,29 @@ Examples:
 
         if args.output:
             output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            write_json(output_data, output_path, compress=args.gzip)
             print(f"Saved to {output_path}", file=sys.stderr)
         else:
-            print(json.dumps(output_data, indent=2))
+            sys.stdout.buffer.write(dump_json(output_data) + b'\n')
     else:
-        # Table output
-        print()
-        print("DATE        SENDER                     SUBJECT")
-        print("-" * 80)
-        for msg in messages:
+        # Table output, printed page by page as results arrive
+        count = 0
+        for msg in client.iter_search(query, max_results=args.limit):
+            if not count:
+                print()
+                print("DATE        SENDER                     SUBJECT")
+                print("-" * 80)
+            count += 1
             print(format_message_row(msg))
             # Show message ID and thread ID for reference
             print(f"            ID: {msg['id']}  Thread: {msg['thread_id']}")
+
+        if not count:
+            print("No messages found.", file=sys.stderr)
+            sys.exit(0)
+
         print()
+        print(f"Found {count} messages", file=sys.stderr)
 
 
 if __name__ == '__main__':
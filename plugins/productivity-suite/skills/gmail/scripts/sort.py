@@ -6,6 +6,7 @@
 #     "google-auth-oauthlib>=1.1.0",
 #     "python-dateutil>=2.8.0",
 #     "markdown>=3.5.0",
+#     "pybase64>=1.3",  # optional: falls back to base64
 # ]
 # ///
 """